@@ -1,5 +1,22 @@
 """Amplifier module for markdown parsing and manipulation."""
 
+from .batch import FileInsertResult
+from .batch import ImageInsertion
+from .batch import apply_manifest
+from .batch import load_manifest
+from .editable import EditableMarkdown
+from .extractors import DocumentStats
+from .extractors import ExtractionPipeline
+from .extractors import ExtractionResult
+from .extractors import Extractor
+from .extractors import Heading
+from .extractors import LineExtractor
+from .extractors import TokenExtractor
+from .line_index import LineIndex
+from .links import LinkInventory
+from .links import LinkRef
+from .links import extract_links
+from .links import extract_links_from_files
 from .metadata import extract_title
 from .metadata import extract_title_from_file
 from .metadata import slugify
@@ -8,7 +25,14 @@ from .models import MarkdownError
 from .models import MarkdownInsertError
 from .models import MarkdownParseError
 from .models import MarkdownSection
+from .models import ParseLimits
 from .parser import MarkdownParser
+from .renderer import HtmlRenderer
+from .shared import SharedCorpus
+from .shared import SharedDocument
+from .shared import SharedSection
+from .store import SectionStore
+from .store import SectionStoreStats
 from .updater import MarkdownImageUpdater
 
 __version__ = "0.1.0"
@@ -17,11 +41,35 @@ __all__ = [
     "extract_title",
     "extract_title_from_file",
     "slugify",
+    "extract_links",
+    "extract_links_from_files",
+    "LinkInventory",
+    "LinkRef",
+    "LineIndex",
     "MarkdownDocument",
     "MarkdownSection",
     "MarkdownError",
     "MarkdownParseError",
     "MarkdownInsertError",
+    "ParseLimits",
     "MarkdownParser",
     "MarkdownImageUpdater",
+    "EditableMarkdown",
+    "HtmlRenderer",
+    "ExtractionPipeline",
+    "ExtractionResult",
+    "Extractor",
+    "TokenExtractor",
+    "LineExtractor",
+    "Heading",
+    "DocumentStats",
+    "SharedCorpus",
+    "SharedDocument",
+    "SharedSection",
+    "SectionStore",
+    "SectionStoreStats",
+    "ImageInsertion",
+    "FileInsertResult",
+    "load_manifest",
+    "apply_manifest",
 ]
@@ -0,0 +1,344 @@
+"""Manifest-driven batch image insertion across many markdown files."""
+
+import argparse
+import json
+import os
+import secrets
+import stat
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from .links import LinkInventory
+from .links import extract_links
+from .models import MarkdownInsertError
+from .updater import MarkdownImageUpdater
+
+_PLACEMENTS = ("at_line", "before_section", "after_intro")
+
+
+@dataclass
+class ImageInsertion:
+    """A single image insertion request from a manifest.
+
+    Attributes:
+        path: Markdown file to update
+        image_path: Relative path to image file
+        alt_text: Alt text for image
+        line_number: Target line number for insertion (None = auto-determine)
+        width: Optional width attribute (HTML img tag)
+        placement: Insertion strategy - "at_line", "before_section", "after_intro"
+        output_path: Where to write the result (None = update ``path`` in place)
+        if_absent: Skip this insertion if the file already shows the image
+
+    Example:
+        >>> spec = ImageInsertion(Path("article.md"), "images/pic.png", "My pic", line_number=4)
+        >>> spec.placement
+        'at_line'
+    """
+
+    path: Path
+    image_path: str
+    alt_text: str = ""
+    line_number: int | None = None
+    width: str | None = "50%"
+    placement: str = "at_line"
+    output_path: Path | None = None
+    if_absent: bool = False
+
+
+@dataclass
+class FileInsertResult:
+    """Outcome of applying all insertions for one file.
+
+    Attributes:
+        path: Markdown file that was processed
+        output_path: File that was (or would be, in dry-run mode) written
+        inserted: Number of images inserted
+        skipped: Number of ``if_absent`` insertions skipped as already present
+        changed: Whether the output content differs from the input
+        written: Whether the output file was actually written
+        error: Error message if processing failed, None on success
+    """
+
+    path: Path
+    output_path: Path
+    inserted: int = 0
+    skipped: int = 0
+    changed: bool = False
+    written: bool = False
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was processed without error."""
+        return self.error is None
+
+
+@dataclass
+class _FileJob:
+    """All insertions targeting one (input, output) file pair."""
+
+    path: Path
+    output_path: Path
+    insertions: list[ImageInsertion] = field(default_factory=list)
+
+
+def load_manifest(path: Path) -> list[ImageInsertion]:
+    """Load image insertions from a JSONL manifest.
+
+    Each non-empty line is a JSON object with ``path`` and ``image_path``
+    keys, plus any optional ``ImageInsertion`` fields. Relative ``path`` and
+    ``output_path`` values are resolved against the manifest's directory.
+
+    Args:
+        path: Path to JSONL manifest file
+
+    Returns:
+        List of insertion specs in manifest order
+
+    Raises:
+        MarkdownInsertError: If a line is not valid JSON or lacks required keys
+
+    Examples:
+        >>> specs = load_manifest(Path("manifest.jsonl"))
+    """
+    base = path.parent
+    specs: list[ImageInsertion] = []
+    with path.open(encoding="utf-8") as f:
+        for line_num, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                specs.append(_spec_from_record(record, base))
+            except (ValueError, KeyError, TypeError) as e:
+                raise MarkdownInsertError(f"{path}:{line_num}: invalid manifest entry: {e}") from e
+    return specs
+
+
+def apply_manifest(
+    insertions: Iterable[ImageInsertion],
+    max_workers: int | None = None,
+    dry_run: bool = False,
+    updater: MarkdownImageUpdater | None = None,
+) -> list[FileInsertResult]:
+    """Apply image insertions grouped by file.
+
+    Insertions for the same file are applied in manifest order against one
+    in-memory copy, so each file is read once and written once. Files are
+    processed in parallel and each output is written atomically (temporary
+    file in the same directory, then ``os.replace``).
+
+    Args:
+        insertions: Insertion specs, in the order they should be applied
+        max_workers: Maximum number of worker threads (None = executor default)
+        dry_run: Compute results without writing any files
+        updater: Updater used to render insertions (default: new MarkdownImageUpdater)
+
+    Returns:
+        One result per output file, in first-seen order
+
+    Raises:
+        MarkdownInsertError: If two different input files target the same output
+
+    Examples:
+        >>> results = apply_manifest(load_manifest(Path("manifest.jsonl")), dry_run=True)
+        >>> failed = [r for r in results if not r.ok]
+    """
+    updater = updater or MarkdownImageUpdater()
+
+    # Key by resolved output so aliases of one file never become concurrent writers
+    jobs: dict[Path, _FileJob] = {}
+    sources: dict[Path, Path] = {}
+    for spec in insertions:
+        output_path = spec.output_path or spec.path
+        key = output_path.resolve()
+        source = spec.path.resolve()
+        if key not in jobs:
+            jobs[key] = _FileJob(spec.path, output_path)
+            sources[key] = source
+        elif sources[key] != source:
+            raise MarkdownInsertError(f"{output_path} is the output of both {jobs[key].path} and {spec.path}")
+        jobs[key].insertions.append(spec)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda job: _apply_job(job, updater, dry_run), jobs.values()))
+
+
+def _spec_from_record(record: dict, base: Path) -> ImageInsertion:
+    """Build an ImageInsertion from a manifest record.
+
+    Args:
+        record: Decoded manifest line
+        base: Directory that relative paths are resolved against
+
+    Returns:
+        ImageInsertion spec
+
+    Raises:
+        KeyError: If a required key is missing
+        TypeError: If a field has the wrong type
+        ValueError: If placement is not a known strategy
+    """
+    if not isinstance(record, dict):
+        raise TypeError(f"expected a JSON object, got {type(record).__name__}")
+    _check_type(record, "path", str)
+    _check_type(record, "image_path", str)
+    _check_type(record, "alt_text", str)
+    _check_type(record, "line_number", int, optional=True)
+    _check_type(record, "width", str, optional=True)
+    _check_type(record, "placement", str)
+    _check_type(record, "output_path", str, optional=True)
+    _check_type(record, "if_absent", bool)
+
+    placement = record.get("placement", "at_line")
+    if placement not in _PLACEMENTS:
+        raise ValueError(f"placement must be one of {', '.join(_PLACEMENTS)}, not {placement!r}")
+
+    output_path = record.get("output_path")
+    return ImageInsertion(
+        path=base / record["path"],
+        image_path=record["image_path"],
+        alt_text=record.get("alt_text", ""),
+        line_number=record.get("line_number"),
+        width=record.get("width", "50%"),
+        placement=placement,
+        output_path=base / output_path if output_path else None,
+        if_absent=record.get("if_absent", False),
+    )
+
+
+def _check_type(record: dict, key: str, expected: type, optional: bool = False) -> None:
+    """Check the type of a manifest field, if present.
+
+    Args:
+        record: Decoded manifest line
+        key: Field name
+        expected: Required type
+        optional: Whether null is allowed
+
+    Raises:
+        KeyError: If a required key (path, image_path) is missing
+        TypeError: If the value has the wrong type
+    """
+    if key not in record:
+        if key in ("path", "image_path"):
+            raise KeyError(key)
+        return
+    value = record[key]
+    if value is None and optional:
+        return
+    # bool is a subclass of int, but true/false is never a valid line number
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        raise TypeError(f"{key} must be {expected.__name__}{' or null' if optional else ''}, not {value!r}")
+
+
+def _apply_job(job: _FileJob, updater: MarkdownImageUpdater, dry_run: bool) -> FileInsertResult:
+    """Apply all insertions for one file with a single read and write.
+
+    Args:
+        job: Insertions targeting one file pair
+        updater: Updater used to render insertions
+        dry_run: Skip writing the output file
+
+    Returns:
+        Per-file result; errors are captured rather than raised
+    """
+    result = FileInsertResult(path=job.path, output_path=job.output_path)
+    try:
+        original = job.path.read_text(encoding="utf-8")
+        updated = original
+        inventory: LinkInventory | None = None
+        for spec in job.insertions:
+            if spec.if_absent:
+                if inventory is None:
+                    inventory = extract_links(updated)
+                if inventory.has_image(spec.image_path):
+                    result.skipped += 1
+                    continue
+            updated = updater.insert_image(
+                updated, spec.line_number, spec.image_path, spec.alt_text, spec.width, spec.placement
+            )
+            if inventory is not None:
+                inventory.image_targets.add(spec.image_path)
+            result.inserted += 1
+
+        result.changed = updated != original
+        if not dry_run and (result.changed or job.output_path != job.path):
+            _atomic_write_text(job.output_path, updated)
+            result.written = True
+    except (OSError, UnicodeDecodeError, MarkdownInsertError, TypeError, ValueError) as e:
+        # Specs built in code skip manifest validation, so bad field types land here
+        result.error = str(e)
+    return result
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write text to a file atomically.
+
+    Args:
+        path: Destination file
+        content: Text to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_name = path.parent / f".{path.name}.{secrets.token_hex(8)}.tmp"
+    # Created like a regular new file, so the kernel applies the process umask
+    fd = os.open(tmp_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        # Replacing an existing file keeps its mode
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: apply a JSONL manifest of image insertions.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (0 if every file succeeded, 1 if any failed, 2 for an invalid manifest)
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m amplifier_module_markdown_utils.batch",
+        description="Insert images into markdown files from a JSONL manifest.",
+    )
+    arg_parser.add_argument("manifest", type=Path, help="JSONL manifest of image insertions")
+    arg_parser.add_argument("--workers", type=int, default=None, help="maximum parallel workers")
+    arg_parser.add_argument("--dry-run", action="store_true", help="report changes without writing files")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        results = apply_manifest(load_manifest(args.manifest), max_workers=args.workers, dry_run=args.dry_run)
+    except (OSError, MarkdownInsertError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    for result in results:
+        if result.error:
+            status = f"error: {result.error}"
+        elif result.written:
+            status = f"inserted {result.inserted}"
+        elif result.changed:
+            status = f"would insert {result.inserted}"
+        else:
+            status = "unchanged"
+        if result.skipped:
+            status += f", skipped {result.skipped} already present"
+        print(f"{result.path}: {status}")
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
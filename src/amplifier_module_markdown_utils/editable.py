@@ -0,0 +1,389 @@
+"""Editable markdown buffer for applying many edits before a single render."""
+
+import random
+from collections.abc import Iterator
+
+from .models import MarkdownDocument
+from .models import MarkdownInsertError
+from .parser import MarkdownParser
+from .parser import _section_heading
+from .updater import MarkdownImageUpdater
+
+
+class _Piece:
+    """A run of lines from a backing buffer, stored as a node of an implicit treap.
+
+    Nodes are ordered by position; ``size`` and ``headings`` hold subtree
+    totals so position lookups and "next heading" searches are O(log n).
+    Section headings always occupy a single-line piece of their own, so a
+    heading node doubles as a stable anchor for its section.
+    """
+
+    __slots__ = ("lines", "start", "length", "heading", "priority", "left", "right", "parent", "size", "headings")
+
+    def __init__(self, lines: list[str], start: int, length: int, heading: tuple[str, int] | None = None):
+        self.lines = lines
+        self.start = start
+        self.length = length
+        self.heading = heading
+        self.priority = random.random()
+        self.left: _Piece | None = None
+        self.right: _Piece | None = None
+        self.parent: _Piece | None = None
+        self.size = length
+        self.headings = 1 if heading else 0
+
+
+def _size(node: _Piece | None) -> int:
+    return node.size if node else 0
+
+
+def _update(node: _Piece) -> None:
+    node.size = node.length
+    node.headings = 1 if node.heading else 0
+    for child in (node.left, node.right):
+        if child:
+            node.size += child.size
+            node.headings += child.headings
+            child.parent = node
+
+
+def _merge(a: _Piece | None, b: _Piece | None) -> _Piece | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _split(node: _Piece | None, k: int) -> tuple[_Piece | None, _Piece | None]:
+    """Split a treap into the first ``k`` lines and the rest."""
+    if node is None:
+        return None, None
+    left_size = _size(node.left)
+    if k <= left_size:
+        left, right = _split(node.left, k)
+        node.left = right
+        _update(node)
+        return left, node
+    if k >= left_size + node.length:
+        left, right = _split(node.right, k - left_size - node.length)
+        node.right = left
+        _update(node)
+        return node, right
+
+    # Split falls inside this piece; headings are single-line so never split here
+    offset = k - left_size
+    tail = _Piece(node.lines, node.start + offset, node.length - offset)
+    right = _merge(tail, node.right)
+    node.right = None
+    node.length = offset
+    _update(node)
+    return node, right
+
+
+class EditableMarkdown:
+    """Mutable markdown buffer backed by a piece table.
+
+    The document's lines are split once; edits only add or split pieces in a
+    balanced tree, so each insertion or deletion costs O(log n) instead of a
+    full split and join. Line numbers are 0-indexed, matching
+    ``MarkdownSection.line_number`` and ``MarkdownImageUpdater``, and always
+    refer to the current (edited) text. Content is rendered once by ``render``.
+
+    Examples:
+        >>> doc = MarkdownParser().parse("# Title\\n\\nIntro\\n\\n## Section\\n\\nText")
+        >>> editable = EditableMarkdown(doc)
+        >>> editable.insert_image(2, "images/pic.png", "My pic")
+        >>> editable.section_line("Section")
+        7
+        >>> updated = editable.render()
+    """
+
+    def __init__(self, document: MarkdownDocument):
+        """Create an editable buffer from a parsed document.
+
+        Args:
+            document: Parsed document; its sections locate the headings
+        """
+        self.title = document.title
+        self._updater = MarkdownImageUpdater()
+        self._sections: dict[str, list[_Piece]] = {}
+
+        lines = document.raw_content.split("\n")
+        headings = {s.line_number: (s.title, s.level) for s in document.sections}
+        self._root = self._build(lines, headings)
+
+    @classmethod
+    def from_text(cls, content: str, parser: MarkdownParser | None = None) -> "EditableMarkdown":
+        """Parse markdown content and wrap it in an editable buffer.
+
+        Args:
+            content: Markdown content
+            parser: Parser to use (default: new MarkdownParser)
+
+        Returns:
+            Editable buffer over the content
+        """
+        return cls((parser or MarkdownParser()).parse(content))
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the current text."""
+        return _size(self._root)
+
+    def get_line(self, line_number: int) -> str:
+        """Return the text of one line.
+
+        Args:
+            line_number: 0-indexed line number
+
+        Returns:
+            Line text without trailing newline
+
+        Raises:
+            MarkdownInsertError: If the line number is out of range
+        """
+        if not 0 <= line_number < self.line_count:
+            raise MarkdownInsertError(f"Line {line_number} out of range (0-{self.line_count - 1})")
+        node = self._root
+        while node:
+            left_size = _size(node.left)
+            if line_number < left_size:
+                node = node.left
+            elif line_number < left_size + node.length:
+                return node.lines[node.start + line_number - left_size]
+            else:
+                line_number -= left_size + node.length
+                node = node.right
+        raise AssertionError("unreachable")
+
+    def insert_lines(self, line_number: int, text: str) -> None:
+        """Insert text before a line.
+
+        Args:
+            line_number: 0-indexed line to insert before (``line_count`` appends)
+            text: Text to insert; may span multiple lines
+
+        Raises:
+            MarkdownInsertError: If the line number is out of range
+        """
+        if not 0 <= line_number <= self.line_count:
+            raise MarkdownInsertError(f"Line {line_number} out of range (0-{self.line_count})")
+        left, right = _split(self._root, line_number)
+        middle = self._build(text.split("\n"))
+        self._set_root(_merge(_merge(left, middle), right))
+
+    def delete_lines(self, line_number: int, count: int = 1) -> None:
+        """Delete a range of lines.
+
+        Sections whose heading line is deleted can no longer be looked up.
+        Deleting every line leaves one empty line, as ``"".split("\\n")`` does.
+
+        Args:
+            line_number: 0-indexed first line to delete
+            count: Number of lines to delete
+
+        Raises:
+            MarkdownInsertError: If the range is out of bounds
+        """
+        if count < 0 or line_number < 0 or line_number + count > self.line_count:
+            raise MarkdownInsertError(f"Cannot delete lines {line_number}-{line_number + count - 1}")
+        left, rest = _split(self._root, line_number)
+        removed, right = _split(rest, count)
+        for node in self._iter_pieces(removed):
+            if node.heading:
+                self._sections[node.heading[0]].remove(node)
+        self._set_root(_merge(left, right) or _Piece([""], 0, 1))
+
+    def section_line(self, title: str) -> int | None:
+        """Find the current line of a section heading.
+
+        Args:
+            title: Section title (without # markers)
+
+        Returns:
+            0-indexed line of the first section with that title, None if absent
+        """
+        nodes = self._sections.get(title)
+        if not nodes:
+            return None
+        return min(self._rank(node) for node in nodes)
+
+    def insert_before_section(self, title: str, text: str) -> None:
+        """Insert text immediately before a section heading.
+
+        Args:
+            title: Section title
+            text: Text to insert
+
+        Raises:
+            MarkdownInsertError: If no section has that title
+        """
+        self.insert_lines(self._require_section(title), text)
+
+    def insert_after_section(self, title: str, text: str) -> None:
+        """Insert text at the end of a section, before the next heading.
+
+        Args:
+            title: Section title
+            text: Text to insert
+
+        Raises:
+            MarkdownInsertError: If no section has that title
+        """
+        start = self._require_section(title)
+        end = self._next_heading(start + 1)
+        self.insert_lines(self.line_count if end is None else end, text)
+
+    def insert_image(
+        self,
+        line_number: int | None,
+        image_path: str,
+        alt_text: str = "",
+        width: str | None = "50%",
+    ) -> None:
+        """Insert an image at a line, matching ``MarkdownImageUpdater.insert_image``.
+
+        Args:
+            line_number: Target line number (None = middle of document)
+            image_path: Relative path to image file
+            alt_text: Alt text for image
+            width: Optional width attribute (HTML img tag)
+        """
+        if line_number is None:
+            line_number = self.line_count // 2
+        if line_number < 0:
+            return
+        image_markdown = self._updater._create_image_markdown(image_path, alt_text, width)
+        self.insert_lines(min(line_number, self.line_count), image_markdown)
+
+    def render(self) -> str:
+        """Render the current text.
+
+        Returns:
+            Markdown content with all edits applied
+        """
+        lines: list[str] = []
+        for node in self._iter_pieces(self._root):
+            lines.extend(node.lines[node.start : node.start + node.length])
+        return "\n".join(lines)
+
+    def to_document(self, parser: MarkdownParser | None = None) -> MarkdownDocument:
+        """Render and re-parse the current text.
+
+        Args:
+            parser: Parser to use (default: new MarkdownParser)
+
+        Returns:
+            Parsed document for the edited content
+        """
+        return (parser or MarkdownParser()).parse(self.render())
+
+    def _build(self, lines: list[str], headings: dict[int, tuple[str, int]] | None = None) -> _Piece | None:
+        """Build a treap over lines, giving each section heading its own piece.
+
+        Args:
+            lines: Backing buffer for the new pieces
+            headings: Heading line indexes (None = detect with parser rules)
+
+        Returns:
+            Root of the new treap
+        """
+        if headings is None:
+            headings = {}
+            for i, line in enumerate(lines):
+                heading = _section_heading(line.strip())
+                if heading:
+                    headings[i] = heading
+
+        root: _Piece | None = None
+        run_start = 0
+        for i in sorted(headings):
+            if i > run_start:
+                root = _merge(root, _Piece(lines, run_start, i - run_start))
+            node = _Piece(lines, i, 1, headings[i])
+            self._sections.setdefault(headings[i][0], []).append(node)
+            root = _merge(root, node)
+            run_start = i + 1
+        if run_start < len(lines):
+            root = _merge(root, _Piece(lines, run_start, len(lines) - run_start))
+        if root:
+            root.parent = None
+        return root
+
+    def _set_root(self, root: _Piece | None) -> None:
+        if root:
+            root.parent = None
+        self._root = root
+
+    def _rank(self, node: _Piece) -> int:
+        """Return the current first line of a piece."""
+        position = _size(node.left)
+        while node.parent:
+            if node is node.parent.right:
+                position += _size(node.parent.left) + node.parent.length
+            node = node.parent
+        return position
+
+    def _next_heading(self, line_number: int) -> int | None:
+        """Return the first heading line at or after a line, None if there is none."""
+        node = self._root
+        base = 0
+        candidates: list[tuple[_Piece, int]] = []
+        # Descend toward line_number, remembering right-hand subtrees to try in order
+        while node and node.headings:
+            node_start = base + _size(node.left)
+            if line_number < node_start:
+                candidates.append((node, base))
+                node = node.left
+            else:
+                if node.heading and node_start >= line_number:
+                    return node_start
+                base = node_start + node.length
+                node = node.right
+        while candidates:
+            parent, parent_base = candidates.pop()
+            parent_start = parent_base + _size(parent.left)
+            if parent.heading:
+                return parent_start
+            if parent.right and parent.right.headings:
+                return self._first_heading(parent.right, parent_start + parent.length)
+        return None
+
+    def _first_heading(self, node: _Piece, base: int) -> int:
+        """Return the line of the first heading in a subtree known to contain one."""
+        while True:
+            if node.left and node.left.headings:
+                node = node.left
+                continue
+            node_start = base + _size(node.left)
+            if node.heading:
+                return node_start
+            base = node_start + node.length
+            assert node.right is not None
+            node = node.right
+
+    def _require_section(self, title: str) -> int:
+        line_number = self.section_line(title)
+        if line_number is None:
+            raise MarkdownInsertError(f"Section not found: {title}")
+        return line_number
+
+    @staticmethod
+    def _iter_pieces(node: _Piece | None) -> Iterator[_Piece]:
+        """Yield pieces in document order."""
+        stack: list[_Piece] = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
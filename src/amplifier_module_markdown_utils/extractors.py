@@ -0,0 +1,480 @@
+"""Extraction pipeline for document metadata and structure."""
+
+import re
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from .links import _LINK_SYNTAX
+from .links import LinkInventory
+from .links import LinkRef
+from .links import _refs_from_match
+from .parser import _FENCE_PATTERN
+from .parser import _FENCE_SYNTAX
+from .parser import _HEADING_SYNTAX
+from .parser import _heading_text
+from .parser import _iter_lines
+
+_FRONTMATTER_FIELD = re.compile(r"^([A-Za-z0-9_-]+)\s*:\s*(.*)$")
+# Heading lines, code fences and link/image references, found by the one scan that feeds
+# every token extractor. Headings are matched in a lookahead so links in their text are
+# still found. Anchoring on a literal newline rather than a MULTILINE "^" lets the regex
+# engine skip ahead; the first line is matched separately
+_BLOCK_SYNTAX = rf"(?P<block>[^\S\n]*(?:{_FENCE_SYNTAX}|(?={_HEADING_SYNTAX})))"
+_TOKEN = re.compile(rf"(?=[\n!\[<])(?:\n{_BLOCK_SYNTAX}|{_LINK_SYNTAX})", re.IGNORECASE)
+_FIRST_TOKEN = re.compile(_BLOCK_SYNTAX)
+
+
+@dataclass
+class Heading:
+    """A heading found in a markdown document.
+
+    Attributes:
+        title: The heading text (without # markers)
+        level: Heading level (1-6)
+        line_number: Line containing the heading (0-indexed)
+    """
+
+    title: str
+    level: int
+    line_number: int
+
+
+@dataclass
+class DocumentStats:
+    """Size statistics for a markdown document.
+
+    Attributes:
+        lines: Number of lines
+        words: Number of whitespace-separated words
+        characters: Number of characters, excluding newlines
+        reading_time_minutes: Estimated reading time at the extractor's words per minute
+    """
+
+    lines: int
+    words: int
+    characters: int
+    reading_time_minutes: float
+
+
+@dataclass
+class ExtractionResult:
+    """Combined output of an extraction pipeline, keyed by extractor name.
+
+    Attributes:
+        values: Mapping of extractor name to its result
+
+    Example:
+        >>> result = ExtractionPipeline().run("# Title\\n\\nHello world")
+        >>> result.title
+        'Title'
+        >>> result["stats"].words
+        4
+    """
+
+    values: dict[str, object] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> object:
+        return self.values[name]
+
+    def get(self, name: str, default: object = None) -> object:
+        """Return an extractor's result, or a default if it was not run."""
+        return self.values.get(name, default)
+
+    @property
+    def title(self) -> str | None:
+        """Result of the "title" extractor."""
+        value = self.values.get("title")
+        return value if isinstance(value, str) else None
+
+    @property
+    def headings(self) -> list[Heading]:
+        """Result of the "headings" extractor."""
+        value = self.values.get("headings")
+        return value if isinstance(value, list) else []
+
+    @property
+    def stats(self) -> DocumentStats | None:
+        """Result of the "stats" extractor."""
+        value = self.values.get("stats")
+        return value if isinstance(value, DocumentStats) else None
+
+    @property
+    def links(self) -> LinkInventory | None:
+        """Result of the "links" extractor."""
+        value = self.values.get("links")
+        return value if isinstance(value, LinkInventory) else None
+
+    @property
+    def frontmatter(self) -> dict[str, str]:
+        """Result of the "frontmatter" extractor."""
+        value = self.values.get("frontmatter")
+        return value if isinstance(value, dict) else {}
+
+
+class Extractor(ABC):
+    """Base class for pipeline extractors.
+
+    A fresh instance is created for every document and ``extract`` is
+    called once with the whole content, so an extractor can do its work
+    with a few regex scans in C rather than per-line Python calls. To
+    share the pipeline's scan instead, subclass ``TokenExtractor`` or
+    ``LineExtractor``. Subclasses set ``name``, the key of their result in
+    ExtractionResult.
+
+    Examples:
+        >>> class TodoExtractor(Extractor):
+        ...     name = "todos"
+        ...     def extract(self, content):
+        ...         return [match.start() for match in re.finditer("TODO", content)]
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def extract(self, content: str) -> object:
+        """Extract a value from a document.
+
+        Args:
+            content: Markdown content
+
+        Returns:
+            The extracted value
+        """
+
+
+class TokenExtractor(Extractor):
+    """Base class for extractors fed by the pipeline's shared token scan.
+
+    The pipeline finds heading lines, code fences and link/image references
+    with one regex scan and passes each heading and link to every token
+    extractor, so any number of them cost a single pass. Override the
+    hooks you need, plus ``result``.
+
+    Examples:
+        >>> class ExternalLinks(TokenExtractor):
+        ...     name = "external_links"
+        ...     def __init__(self):
+        ...         self.targets = []
+        ...     def feed_link(self, ref):
+        ...         if ref.target.startswith("https://"):
+        ...             self.targets.append(ref.target)
+        ...     def result(self):
+        ...         return self.targets
+    """
+
+    def feed_heading(self, heading: Heading, line: str, in_code: bool) -> None:
+        """Consume an ATX heading line.
+
+        Args:
+            heading: The heading, without closing #s
+            line: The whole line, stripped
+            in_code: Whether the line is inside a fenced code block, where it is not a heading
+        """
+
+    def feed_link(self, ref: LinkRef) -> None:
+        """Consume a link or image reference, as ``extract_links`` reports it.
+
+        Args:
+            ref: Reference, in document order
+        """
+
+    @abstractmethod
+    def result(self) -> object:
+        """Return the extracted value after the scan."""
+
+    def extract(self, content: str) -> object:
+        _scan_tokens(content, [self])
+        return self.result()
+
+
+class LineExtractor(Extractor):
+    """Base class for extractors that consume a document line by line.
+
+    The pipeline feeds all of its line extractors from one shared line
+    scan, so several of them cost a single pass. Prefer ``Extractor`` when
+    the work can be done on the whole content.
+
+    Examples:
+        >>> class TodoLines(LineExtractor):
+        ...     name = "todo_lines"
+        ...     def __init__(self):
+        ...         self.todos = []
+        ...     def feed(self, line, line_number, offset, in_code):
+        ...         if "TODO" in line:
+        ...             self.todos.append(line_number)
+        ...     def result(self):
+        ...         return self.todos
+    """
+
+    @abstractmethod
+    def feed(self, line: str, line_number: int, offset: int, in_code: bool) -> None:
+        """Consume one line.
+
+        Args:
+            line: Line text without its newline
+            line_number: Line number (0-indexed)
+            offset: Character offset of the line start in the content
+            in_code: Whether the line is inside (or delimits) a fenced code block
+        """
+
+    @abstractmethod
+    def result(self) -> object:
+        """Return the extracted value after all lines have been fed."""
+
+    def extract(self, content: str) -> object:
+        _feed_lines(content, [self])
+        return self.result()
+
+
+class TitleExtractor(TokenExtractor):
+    """First H1 heading, matching ``extract_title``."""
+
+    name = "title"
+
+    def __init__(self):
+        self.title: str | None = None
+
+    def feed_heading(self, heading: Heading, line: str, in_code: bool) -> None:
+        # Like extract_title, take the first "# " line even inside a code block
+        if self.title is None and line.startswith("# "):
+            self.title = line[2:].strip()
+
+    def result(self) -> str | None:
+        return self.title
+
+
+class HeadingsExtractor(TokenExtractor):
+    """All ATX headings outside fenced code blocks."""
+
+    name = "headings"
+
+    def __init__(self):
+        self.headings: list[Heading] = []
+
+    def feed_heading(self, heading: Heading, line: str, in_code: bool) -> None:
+        if not in_code:
+            self.headings.append(heading)
+
+    def result(self) -> list[Heading]:
+        return self.headings
+
+
+class StatsExtractor(Extractor):
+    """Line, word and character counts with an estimated reading time."""
+
+    name = "stats"
+
+    def __init__(self, words_per_minute: int = 200):
+        self.words_per_minute = words_per_minute
+
+    def extract(self, content: str) -> DocumentStats:
+        newlines = content.count("\n")
+        words = len(content.split())
+        return DocumentStats(
+            lines=newlines + 1,
+            words=words,
+            characters=len(content) - newlines,
+            reading_time_minutes=words / self.words_per_minute,
+        )
+
+
+class LinksExtractor(TokenExtractor):
+    """Inline links, markdown images and HTML images, as in ``extract_links``."""
+
+    name = "links"
+
+    def __init__(self):
+        self.inventory = LinkInventory()
+
+    def feed_link(self, ref: LinkRef) -> None:
+        self.inventory.add(ref)
+
+    def result(self) -> LinkInventory:
+        return self.inventory
+
+
+class FrontmatterExtractor(Extractor):
+    """Flat ``key: value`` pairs from a leading ``---`` delimited block."""
+
+    name = "frontmatter"
+
+    def extract(self, content: str) -> dict[str, str]:
+        lines = _iter_lines(content)
+        if next(lines).strip() != "---":
+            return {}
+
+        fields: dict[str, str] = {}
+        for line in lines:
+            if line.strip() in ("---", "..."):
+                return fields
+            match = _FRONTMATTER_FIELD.match(line)
+            if match:
+                fields[match.group(1)] = match.group(2).strip().strip("\"'")
+        # An unterminated block is not frontmatter
+        return {}
+
+
+ExtractorFactory = Callable[[], Extractor]
+
+DEFAULT_EXTRACTORS: tuple[ExtractorFactory, ...] = (
+    TitleExtractor,
+    HeadingsExtractor,
+    StatsExtractor,
+    LinksExtractor,
+    FrontmatterExtractor,
+)
+
+
+class ExtractionPipeline:
+    """Runs several extractors over a document.
+
+    Extractors are registered as classes (or any zero-argument factory) and
+    instantiated per document, so a pipeline can be reused across threads.
+    All ``TokenExtractor`` instances (the title, heading and link built-ins)
+    share one regex scan, and all ``LineExtractor`` instances share one line
+    scan. Any other ``Extractor`` works on the whole content itself; the
+    stats built-in counts with ``str`` methods and frontmatter reads only
+    the leading block.
+
+    Examples:
+        >>> pipeline = ExtractionPipeline()
+        >>> pipeline.register(TodoExtractor)
+        >>> result = pipeline.run(content)
+        >>> result.title, result.stats.words, result["todos"]
+    """
+
+    def __init__(self, extractors: list[ExtractorFactory] | None = None):
+        """Create a pipeline.
+
+        Args:
+            extractors: Extractor factories (default: DEFAULT_EXTRACTORS)
+        """
+        self.extractors = list(DEFAULT_EXTRACTORS if extractors is None else extractors)
+
+    def register(self, extractor: ExtractorFactory) -> None:
+        """Add an extractor to the pipeline.
+
+        Args:
+            extractor: Extractor factory
+        """
+        self.extractors.append(extractor)
+
+    def run(self, content: str) -> ExtractionResult:
+        """Run every extractor over markdown content.
+
+        Args:
+            content: Markdown content
+
+        Returns:
+            Combined results keyed by extractor name
+        """
+        instances = [factory() for factory in self.extractors]
+        token_extractors = [instance for instance in instances if isinstance(instance, TokenExtractor)]
+        if token_extractors:
+            _scan_tokens(content, token_extractors)
+        line_extractors = [instance for instance in instances if isinstance(instance, LineExtractor)]
+        if line_extractors:
+            _feed_lines(content, line_extractors)
+
+        values: dict[str, object] = {}
+        for instance in instances:
+            if isinstance(instance, (TokenExtractor, LineExtractor)):
+                values[instance.name] = instance.result()
+            else:
+                values[instance.name] = instance.extract(content)
+        return ExtractionResult(values)
+
+    def run_file(self, path: Path) -> ExtractionResult:
+        """Run every extractor over a markdown file.
+
+        Args:
+            path: Path to markdown file
+
+        Returns:
+            Combined results keyed by extractor name
+        """
+        return self.run(path.read_text(encoding="utf-8"))
+
+
+def _iter_tokens(content: str) -> Iterator[re.Match[str]]:
+    """Yield a match for every heading line, code fence and link or image, in order.
+
+    Args:
+        content: Markdown content
+
+    Yields:
+        Matches with "fence"/"info", "hashes"/"heading" or link pattern groups set
+    """
+    first = _FIRST_TOKEN.match(content)
+    if first is not None:
+        yield first
+    yield from _TOKEN.finditer(content, first.end() if first is not None else 0)
+
+
+def _scan_tokens(content: str, extractors: list[TokenExtractor]) -> None:
+    """Feed headings and links to token extractors from one regex scan.
+
+    Args:
+        content: Markdown content
+        extractors: Token extractors to feed
+    """
+    # Skip hooks an extractor does not override
+    heading_feeds = [e.feed_heading for e in extractors if type(e).feed_heading is not TokenExtractor.feed_heading]
+    link_feeds = [e.feed_link for e in extractors if type(e).feed_link is not TokenExtractor.feed_link]
+    fence: str | None = None
+    line_number = 0
+    line_scan_pos = 0
+
+    for match in _iter_tokens(content):
+        block_start = match.start("block")
+        offset = block_start if block_start != -1 else match.start()
+        line_number += content.count("\n", line_scan_pos, offset)
+        line_scan_pos = offset
+
+        marker = match.group("fence")
+        if marker is not None:
+            if fence is None:
+                fence = marker
+            elif marker.startswith(fence):
+                fence = None
+        elif match.group("hashes") is not None:
+            heading = Heading(_heading_text(match.group("heading")), len(match.group("hashes")), line_number)
+            line = content[block_start : match.end("heading")].strip()
+            for feed in heading_feeds:
+                feed(heading, line, fence is not None)
+        elif link_feeds:
+            for ref in _refs_from_match(match, line_number, offset):
+                for feed in link_feeds:
+                    feed(ref)
+
+
+def _feed_lines(content: str, extractors: list[LineExtractor]) -> None:
+    """Feed every line of content to line extractors in one scan.
+
+    Args:
+        content: Markdown content
+        extractors: Line extractors to feed
+    """
+    feeds = [extractor.feed for extractor in extractors]
+    fence: str | None = None
+    offset = 0
+
+    for line_number, line in enumerate(_iter_lines(content)):
+        in_code = fence is not None
+        if "`" in line or "~" in line:
+            match = _FENCE_PATTERN.match(line)
+            if match:
+                if fence is None:
+                    fence = match.group("fence")
+                    in_code = True
+                elif match.group("fence").startswith(fence):
+                    fence = None
+
+        for feed in feeds:
+            feed(line, line_number, offset, in_code)
+        offset += len(line) + 1
@@ -0,0 +1,200 @@
+"""Line-start offset index for addressing lines without splitting content."""
+
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+
+# Skip whole lines in C, largest step first, to reach a line without visiting each one;
+# possessive quantifiers keep the regex engine from saving backtracking state per line
+_LINE_SKIPS = [(count, re.compile(r"(?:[^\n]*+\n){%d}+" % count)) for count in (4096, 256, 16, 1)]
+
+
+class LineIndex:
+    """Compact index of line-start offsets for a string.
+
+    Built with one ``str.find`` sweep into an ``array`` of offsets (8 bytes
+    per line), so lines can be addressed by slicing the original string instead
+    of allocating one string per line with ``split``. Line numbers are
+    0-indexed and match ``content.split("\\n")``.
+
+    Attributes:
+        content: The indexed text
+
+    Examples:
+        >>> index = LineIndex("# Title\\n\\nBody")
+        >>> index.line_count
+        3
+        >>> index.line(2)
+        'Body'
+        >>> index.line_of(8)
+        1
+        >>> index.insert_at_line(1, "Inserted")
+        '# Title\\nInserted\\n\\nBody'
+    """
+
+    __slots__ = ("content", "_starts")
+
+    def __init__(self, content: str):
+        self.content = content
+        self._starts = starts = array("q", [0])
+        find = content.find
+        append = starts.append
+        position = find("\n") + 1
+        while position:
+            append(position)
+            position = find("\n", position) + 1
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, as ``len(content.split("\\n"))``."""
+        return len(self._starts)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line_start(self, line_number: int) -> int:
+        """Offset of the first character of a line.
+
+        Args:
+            line_number: 0-indexed line number; ``line_count`` gives the content length
+
+        Returns:
+            Character offset into content
+        """
+        if line_number == len(self._starts):
+            return len(self.content)
+        return self._starts[line_number]
+
+    def line_end(self, line_number: int) -> int:
+        """Offset just past the last character of a line, excluding its newline.
+
+        Args:
+            line_number: 0-indexed line number
+
+        Returns:
+            Character offset into content
+        """
+        if line_number + 1 < len(self._starts):
+            return self._starts[line_number + 1] - 1
+        return len(self.content)
+
+    def line(self, line_number: int) -> str:
+        """Return one line without its newline.
+
+        Args:
+            line_number: 0-indexed line number
+
+        Returns:
+            Line text
+        """
+        return self.content[self._starts[line_number] : self.line_end(line_number)]
+
+    def lines(self, start: int, stop: int) -> Iterator[str]:
+        """Yield lines ``start`` to ``stop - 1``, stopping early at the end of the content.
+
+        Args:
+            start: First 0-indexed line number
+            stop: Line number to stop before
+
+        Yields:
+            Line text without its newline
+        """
+        for line_number in range(max(0, start), min(stop, len(self._starts))):
+            yield self.line(line_number)
+
+    def line_of(self, offset: int) -> int:
+        """Return the line containing a character offset.
+
+        Args:
+            offset: Character offset into content
+
+        Returns:
+            0-indexed line number
+        """
+        return bisect_right(self._starts, offset) - 1
+
+    def insert_at_line(self, line_number: int, text: str) -> str:
+        """Return content with text inserted as new line(s) before a line.
+
+        Equivalent to ``lines.insert(line_number, text)`` followed by
+        ``"\\n".join(lines)``, built from two slices of the original string.
+
+        Args:
+            line_number: 0-indexed line to insert before (``line_count`` appends)
+            text: Text to insert
+
+        Returns:
+            Updated content
+        """
+        if line_number >= len(self._starts):
+            return f"{self.content}\n{text}"
+        offset = self._starts[line_number]
+        return f"{self.content[:offset]}{text}\n{self.content[offset:]}"
+
+
+class _LineCursor:
+    """Line addressing for a one-off edit, without indexing the whole content.
+
+    Skips to a starting line, then serves that line and the ones after it
+    with ``str.find``. Offers the ``lines``/``insert_at_line`` subset of
+    LineIndex for line numbers from the starting line on.
+    """
+
+    __slots__ = ("content", "_line", "_offset")
+
+    def __init__(self, content: str, line_number: int):
+        self.content = content
+        self._line = max(0, line_number)
+        self._offset = _skip_lines(content, self._line)
+
+    def line_start(self, line_number: int) -> int:
+        """Offset of a line at or after the starting line, -1 past the last line."""
+        offset = self._offset
+        for _ in range(line_number - self._line):
+            if offset == -1:
+                break
+            offset = self.content.find("\n", offset)
+            offset = -1 if offset == -1 else offset + 1
+        return offset
+
+    def lines(self, start: int, stop: int) -> Iterator[str]:
+        """Yield lines ``start`` to ``stop - 1``, as ``LineIndex.lines``."""
+        offset = self.line_start(max(start, self._line))
+        for _ in range(max(start, self._line), stop):
+            if offset == -1:
+                return
+            end = self.content.find("\n", offset)
+            if end == -1:
+                yield self.content[offset:]
+                return
+            yield self.content[offset:end]
+            offset = end + 1
+
+    def insert_at_line(self, line_number: int, text: str) -> str:
+        """Return content with text inserted before a line, as ``LineIndex.insert_at_line``."""
+        offset = self.line_start(line_number)
+        if offset == -1:
+            return f"{self.content}\n{text}"
+        return f"{self.content[:offset]}{text}\n{self.content[offset:]}"
+
+
+def _skip_lines(content: str, count: int) -> int:
+    """Return the offset of line ``count``, or -1 if the content has fewer lines.
+
+    Args:
+        content: Text to walk
+        count: 0-indexed line number to reach
+
+    Returns:
+        Character offset of the line start
+    """
+    offset = 0
+    for step, pattern in _LINE_SKIPS:
+        while count >= step:
+            match = pattern.match(content, offset)
+            if match is None:
+                break
+            offset = match.end()
+            count -= step
+    return offset if count == 0 else -1
@@ -0,0 +1,189 @@
+"""Single-pass link and image inventory for markdown content."""
+
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+# Link text may contain a whole image, as in a linked badge: [![alt](src)](href)
+_NESTED_IMAGE = r"!\[[^\]\n]*\]\([^)\s]+(?:\s+\"[^\"\n]*\")?\)"
+# Bracket text, titles and tags stop at a newline (or the next tag), so an
+# unclosed "[" costs one line of scanning rather than the rest of the content.
+# Shared with the extraction pipeline's token scan
+_LINK_SYNTAX = (
+    r"!\[(?P<img_alt>[^\]\n]*)\]\((?P<img_src>[^)\s]+)(?:\s+\"[^\"\n]*\")?\)"
+    rf"|(?<!!)\[(?P<link_text>(?>{_NESTED_IMAGE}|[^\]\n])*)\]\((?P<link_href>[^)\s]+)(?:\s+\"[^\"\n]*\")?\)"
+    r"|<img\b(?P<img_attrs>[^<>]*)>"
+)
+# The leading lookahead lets the regex engine skip to candidate characters
+_LINK_PATTERN = re.compile(rf"(?=[!\[<])(?:{_LINK_SYNTAX})", re.IGNORECASE)
+_SRC_ATTR = re.compile(r"""\bsrc\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+_ALT_ATTR = re.compile(r"""\balt\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+
+
+@dataclass
+class LinkRef:
+    """A link or image reference found in markdown content.
+
+    Attributes:
+        kind: "link" for ``[text](href)``, "image" for ``![alt](src)``,
+            "html_image" for ``<img src="...">``
+        target: Link href or image source
+        text: Link text or image alt text
+        line_number: Line containing the reference (0-indexed)
+        offset: Character offset of the reference in the content
+
+    Example:
+        >>> ref = LinkRef("image", "images/pic.png", "My pic", 4, 31)
+        >>> ref.is_image
+        True
+    """
+
+    kind: str
+    target: str
+    text: str
+    line_number: int
+    offset: int
+
+    @property
+    def is_image(self) -> bool:
+        """Whether this reference embeds an image."""
+        return self.kind != "link"
+
+
+@dataclass
+class LinkInventory:
+    """All links and images in a document, with O(1) image lookup.
+
+    Attributes:
+        refs: References in document order
+        image_targets: Set of image sources for membership checks
+    """
+
+    refs: list[LinkRef] = field(default_factory=list)
+    image_targets: set[str] = field(default_factory=set)
+
+    @property
+    def links(self) -> list[LinkRef]:
+        """Inline links (excluding images)."""
+        return [ref for ref in self.refs if not ref.is_image]
+
+    @property
+    def images(self) -> list[LinkRef]:
+        """Markdown and HTML images."""
+        return [ref for ref in self.refs if ref.is_image]
+
+    def add(self, ref: LinkRef) -> None:
+        """Record a reference.
+
+        Args:
+            ref: Reference to append
+        """
+        self.refs.append(ref)
+        if ref.is_image:
+            self.image_targets.add(ref.target)
+
+    def has_image(self, image_path: str) -> bool:
+        """Check whether an image source is already present.
+
+        Args:
+            image_path: Image source to look up
+
+        Returns:
+            True if any image in the document uses this source
+        """
+        return image_path in self.image_targets
+
+
+def extract_links(content: str) -> LinkInventory:
+    """Extract every inline link, markdown image and HTML image in one scan.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        Inventory of references in document order
+
+    Examples:
+        >>> inventory = extract_links("See [docs](https://x.io)\\n\\n![Diagram](images/d.png)")
+        >>> [ref.kind for ref in inventory.refs]
+        ['link', 'image']
+        >>> inventory.has_image("images/d.png")
+        True
+    """
+    inventory = LinkInventory()
+    line_number = 0
+    line_scan_pos = 0
+
+    for match in _LINK_PATTERN.finditer(content):
+        offset = match.start()
+        line_number += content.count("\n", line_scan_pos, offset)
+        line_scan_pos = offset
+
+        for ref in _refs_from_match(match, line_number, offset):
+            inventory.add(ref)
+
+    return inventory
+
+
+def _refs_from_match(match: re.Match[str], line_number: int, offset: int) -> list[LinkRef]:
+    """Build LinkRefs from a link pattern match.
+
+    A link whose text embeds an image (``[![alt](src)](href)``) yields the
+    link followed by the image.
+
+    Args:
+        match: Match of the link pattern
+        line_number: Line containing the match (0-indexed)
+        offset: Character offset of the match in the content
+
+    Returns:
+        References in document order; empty for an ``<img>`` tag without a src attribute
+    """
+    if match.group("img_src") is not None:
+        return [LinkRef("image", match.group("img_src"), match.group("img_alt"), line_number, offset)]
+    if match.group("link_href") is not None:
+        text = match.group("link_text")
+        refs = [LinkRef("link", match.group("link_href"), text, line_number, offset)]
+        if "!" in text or "<" in text:
+            text_offset = offset + match.start("link_text") - match.start()
+            for inner in _LINK_PATTERN.finditer(text):
+                refs.extend(_refs_from_match(inner, line_number, text_offset + inner.start()))
+        return refs
+
+    attrs = match.group("img_attrs")
+    src = _SRC_ATTR.search(attrs)
+    if src is None:
+        return []
+    alt = _ALT_ATTR.search(attrs)
+    return [LinkRef("html_image", src.group(1), alt.group(1) if alt else "", line_number, offset)]
+
+
+def extract_links_from_files(paths: Iterable[Path], max_workers: int | None = None) -> dict[Path, LinkInventory]:
+    """Build link inventories for many files in parallel.
+
+    Files that cannot be read are omitted from the result.
+
+    Args:
+        paths: Markdown files to scan
+        max_workers: Maximum number of worker threads (None = executor default)
+
+    Returns:
+        Mapping of path to inventory, in input order
+
+    Examples:
+        >>> inventories = extract_links_from_files(Path("docs").glob("*.md"))
+    """
+
+    def scan(path: Path) -> LinkInventory | None:
+        try:
+            return extract_links(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(scan, paths)
+        return {path: inventory for path, inventory in zip(paths, results) if inventory is not None}
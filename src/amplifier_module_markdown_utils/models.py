@@ -1,6 +1,9 @@
 """Data models for markdown operations."""
 
 from dataclasses import dataclass
+from dataclasses import field
+
+from .line_index import LineIndex
 
 
 class MarkdownError(Exception):
@@ -58,6 +61,8 @@ class MarkdownDocument:
         title: Document title (first H1 heading), None if no H1 found
         sections: List of sections in the document
         raw_content: Original unparsed markdown content
+        partial: True if parsing stopped early at a ParseLimits limit
+        limit_reason: Which limit stopped parsing, None for a complete parse
 
     Example:
         >>> doc = MarkdownDocument(
@@ -77,3 +82,51 @@ class MarkdownDocument:
     title: str | None
     sections: list[MarkdownSection]
     raw_content: str
+    partial: bool = field(default=False, kw_only=True)
+    limit_reason: str | None = field(default=None, kw_only=True)
+    _line_index: LineIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Line-start index of ``raw_content``, built on first use and cached.
+
+        Pass it to ``MarkdownImageUpdater.insert_image(..., line_index=...)``
+        to insert into ``raw_content`` without re-scanning it.
+        """
+        if self._line_index is None or self._line_index.content is not self.raw_content:
+            self._line_index = LineIndex(self.raw_content)
+        return self._line_index
+
+
+@dataclass
+class ParseLimits:
+    """Resource limits for parsing untrusted markdown.
+
+    Limits are checked inside the parser's scan loop. When one is hit the
+    parser either raises MarkdownParseError or returns the document parsed
+    so far with ``partial=True``, depending on ``on_limit``. A limit of None
+    is not enforced.
+
+    Attributes:
+        max_bytes: Maximum input size (bytes for files, characters for strings)
+        max_lines: Maximum number of lines to scan
+        max_sections: Maximum number of sections to build
+        max_line_length: Maximum characters in a single line
+        timeout: Wall-clock budget in seconds for one parse
+        on_limit: "raise" to raise MarkdownParseError, "truncate" to return a partial document
+
+    Example:
+        >>> limits = ParseLimits(max_bytes=10_000_000, max_sections=10_000, timeout=2.0, on_limit="truncate")
+        >>> parser = MarkdownParser(limits=limits)
+    """
+
+    max_bytes: int | None = None
+    max_lines: int | None = None
+    max_sections: int | None = None
+    max_line_length: int | None = None
+    timeout: float | None = None
+    on_limit: str = "raise"
+
+    def __post_init__(self):
+        if self.on_limit not in ("raise", "truncate"):
+            raise ValueError(f"on_limit must be 'raise' or 'truncate', not {self.on_limit!r}")
@@ -1,14 +1,47 @@
 """Markdown parsing utilities."""
 
+import os
+import re
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from .models import MarkdownDocument
+from .models import MarkdownParseError
 from .models import MarkdownSection
+from .models import ParseLimits
+from .store import SectionStore
+
+# Candidate section heading and title lines; matches are confirmed with the parser's own rules
+_SECTION_LINE = re.compile(r"^[^\S\n]*#{2,3} ", re.MULTILINE)
+_TITLE_LINE = re.compile(r"^[^\S\n]*# ", re.MULTILINE)
+# ATX heading and code fence syntax, shared by the renderer and extractors. A heading's
+# text keeps any closing #s; remove them with _heading_text
+_HEADING_SYNTAX = r"(?P<hashes>#{1,6})[^\S\n]+(?P<heading>\S[^\n]*)"
+_FENCE_SYNTAX = r"(?P<fence>`{3,}|~{3,})[^\S\n]*(?P<info>[\w+-]*)"
+_HEADING_PATTERN = re.compile(rf"[^\S\n]*{_HEADING_SYNTAX}")
+_FENCE_PATTERN = re.compile(rf"[^\S\n]*{_FENCE_SYNTAX}")
+_CLOSING_HASHES = re.compile(r"[^\S\n]+#+$")
 
 
 class MarkdownParser:
     """Parses markdown documents into structured representation."""
 
+    def __init__(self, section_store: SectionStore | None = None, limits: ParseLimits | None = None):
+        """Create a parser.
+
+        Args:
+            section_store: Optional shared store; identical section bodies
+                across parsed documents then share one string
+            limits: Optional resource limits for untrusted input
+        """
+        self.section_store = section_store
+        self.limits = limits
+
     def parse(self, content: str) -> MarkdownDocument:
         """Parse markdown content into structured document.
 
@@ -18,6 +51,9 @@ class MarkdownParser:
         Returns:
             Structured markdown document with sections
 
+        Raises:
+            MarkdownParseError: If a limit is exceeded and ``limits.on_limit`` is "raise"
+
         Examples:
             >>> parser = MarkdownParser()
             >>> doc = parser.parse("# Title\\n\\nContent here\\n\\n## Section\\n\\nMore content")
@@ -26,23 +62,49 @@ class MarkdownParser:
             >>> len(doc.sections)
             1
         """
-        lines = content.split("\n")
+        limits = self.limits
+        limit_reason = None
+        deadline = None
+
+        if limits is None:
+            lines: Iterable[str] = content.split("\n")
+        else:
+            if limits.max_bytes is not None and len(content) > limits.max_bytes:
+                limit_reason = self._limit_hit(f"content exceeds {limits.max_bytes} characters")
+                content = content[: limits.max_bytes]
+            if limits.timeout is not None:
+                deadline = time.monotonic() + limits.timeout
+            # Scan lazily so a line limit never splits the whole input
+            lines = _iter_lines(content)
+
         sections: list[MarkdownSection] = []
         current_section: dict[str, object] = {}
 
         title = None
 
         for line_num, line in enumerate(lines):
+            if limits is not None:
+                reason = self._check_line(limits, line_num, line, deadline)
+                if reason:
+                    limit_reason = self._limit_hit(reason)
+                    break
+
             stripped = line.strip()
 
             if stripped.startswith("# ") and title is None:
                 title = stripped[2:].strip()
                 continue
 
-            if stripped.startswith("## "):
+            if stripped.startswith("## ") or stripped.startswith("### "):
                 if current_section:
                     sections.append(self._finalize_section(current_section))
 
+                if limits is not None and limits.max_sections is not None and len(sections) >= limits.max_sections:
+                    current_section = {}
+                    limit_reason = self._limit_hit(f"more than {limits.max_sections} sections")
+                    break
+
+            if stripped.startswith("## "):
                 current_section = {
                     "title": stripped[3:].strip(),
                     "level": 2,
@@ -50,9 +112,6 @@ class MarkdownParser:
                     "content_lines": [line],
                 }
             elif stripped.startswith("### "):
-                if current_section:
-                    sections.append(self._finalize_section(current_section))
-
                 current_section = {
                     "title": stripped[4:].strip(),
                     "level": 3,
@@ -71,23 +130,253 @@ class MarkdownParser:
             raw_content=content,
             title=title,
             sections=sections,
+            partial=limit_reason is not None,
+            limit_reason=limit_reason,
         )
 
-    def parse_file(self, path: Path) -> MarkdownDocument:
+    def parse_file(self, path: Path, workers: int | None = None) -> MarkdownDocument:
         """Parse markdown file into structured document.
 
+        With ``limits.max_bytes`` set, oversized files are rejected (or only
+        their first ``max_bytes`` bytes are read) before loading the file.
+
         Args:
             path: Path to markdown file
+            workers: Parse large files with this many processes (see ``parse_parallel``)
 
         Returns:
             Structured markdown document
 
+        Raises:
+            MarkdownParseError: If a limit is exceeded and ``limits.on_limit`` is "raise"
+
         Examples:
             >>> parser = MarkdownParser()
             >>> doc = parser.parse_file(Path("article.md"))
         """
+        limits = self.limits
+        if limits is None or limits.max_bytes is None or path.stat().st_size <= limits.max_bytes:
+            content = path.read_text(encoding="utf-8")
+            if workers is not None and workers > 1:
+                return self.parse_parallel(content, workers=workers)
+            return self.parse(content)
+
+        reason = self._limit_hit(f"{path} exceeds {limits.max_bytes} bytes")
+        with path.open("rb") as f:
+            data = f.read(limits.max_bytes)
+        document = self.parse(_decode_prefix(data))
+        document.partial = True
+        document.limit_reason = document.limit_reason or reason
+        return document
+
+    def parse_parallel(
+        self,
+        content: str,
+        workers: int | None = None,
+        min_chunk_size: int = 1_000_000,
+        executor: Executor | None = None,
+    ) -> MarkdownDocument:
+        """Parse a large document by splitting it at section headings across processes.
+
+        The content is cut into roughly equal ranges, each starting on a
+        section heading line, so no section spans two ranges. The first H1
+        is located up front so every range applies the title rule the same
+        way. Ranges are parsed in parallel with line numbers offset to their
+        position in the document, and the results are joined. The result is
+        identical to ``parse``. Small documents, and parsers with limits,
+        are parsed serially.
+
+        Args:
+            content: Markdown content to parse
+            workers: Number of ranges/processes (default: CPU count)
+            min_chunk_size: Minimum characters per range
+            executor: Executor to reuse across calls (default: a new process pool)
+
+        Returns:
+            Structured markdown document with sections
+
+        Examples:
+            >>> parser = MarkdownParser()
+            >>> doc = parser.parse_parallel(Path("report.md").read_text(encoding="utf-8"), workers=8)
+        """
+        workers = workers or os.cpu_count() or 1
+        chunk_count = min(workers, len(content) // max(1, min_chunk_size))
+        if self.limits is not None or chunk_count < 2:
+            return self.parse(content)
+
+        title, title_line = _find_title(content)
+        bounds = _chunk_bounds(content, chunk_count)
+        if len(bounds) < 3:
+            return self.parse(content)
+
+        jobs = []
+        first_line = 0
+        for start, end in zip(bounds, bounds[1:]):
+            # Each range but the last ends with the newline before the next heading
+            chunk_end = end - 1 if end < len(content) else end
+            jobs.append((content[start:chunk_end], first_line, title_line))
+            first_line += content.count("\n", start, end)
+
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                results = list(pool.map(_parse_chunk, *zip(*jobs)))
+        else:
+            results = list(executor.map(_parse_chunk, *zip(*jobs)))
+
+        sections: list[MarkdownSection] = []
+        for chunk_sections in results:
+            for section_title, level, line_number, section_content in chunk_sections:
+                section = MarkdownSection(section_title, level, line_number, section_content)
+                if self.section_store is not None:
+                    self.section_store.add(section)
+                sections.append(section)
+
+        return MarkdownDocument(
+            raw_content=content,
+            title=title,
+            sections=sections,
+        )
+
+    def select_sections(
+        self,
+        content: str,
+        level: int | None = None,
+        title_regex: str | re.Pattern[str] | None = None,
+        where: Callable[[str, int], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[MarkdownSection]:
+        """Parse only the sections matching a filter.
+
+        Filters are checked on each heading line before any body lines are
+        gathered, so content is only built for matching sections, and the
+        scan stops as soon as ``limit`` sections are complete. Results are
+        identical to filtering ``parse(content).sections``.
+
+        Args:
+            content: Markdown content to parse
+            level: Only sections with this heading level
+            title_regex: Only sections whose title matches (``re.search``)
+            where: Only sections for which ``where(title, level)`` is true
+            limit: Stop after this many matching sections
+
+        Returns:
+            Matching sections in document order
+
+        Examples:
+            >>> parser = MarkdownParser()
+            >>> sections = parser.select_sections("## Setup\\n\\nSteps\\n\\n## Usage", level=2, title_regex="^Set")
+            >>> [s.title for s in sections]
+            ['Setup']
+        """
+        pattern = re.compile(title_regex) if isinstance(title_regex, str) else title_regex
+        sections: list[MarkdownSection] = []
+        if limit is not None and limit <= 0:
+            return sections
+
+        current_section: dict[str, object] = {}
+        title_seen = False
+
+        for line_num, line in enumerate(_iter_lines(content)):
+            stripped = line.strip()
+
+            if stripped.startswith("# ") and not title_seen:
+                title_seen = True
+                continue
+
+            heading = _section_heading(stripped)
+            if heading:
+                if current_section:
+                    sections.append(self._finalize_section(current_section))
+                    if limit is not None and len(sections) >= limit:
+                        return sections
+
+                heading_title, heading_level = heading
+                if (
+                    (level is None or heading_level == level)
+                    and (pattern is None or pattern.search(heading_title))
+                    and (where is None or where(heading_title, heading_level))
+                ):
+                    current_section = {
+                        "title": heading_title,
+                        "level": heading_level,
+                        "line_number": line_num,
+                        "content_lines": [line],
+                    }
+                else:
+                    current_section = {}
+            elif current_section:
+                content_lines = current_section.get("content_lines", [])
+                if isinstance(content_lines, list):
+                    content_lines.append(line)
+
+        if current_section:
+            sections.append(self._finalize_section(current_section))
+
+        return sections
+
+    def select_sections_file(
+        self,
+        path: Path,
+        level: int | None = None,
+        title_regex: str | re.Pattern[str] | None = None,
+        where: Callable[[str, int], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[MarkdownSection]:
+        """Parse only the matching sections of a markdown file.
+
+        Args:
+            path: Path to markdown file
+            level: Only sections with this heading level
+            title_regex: Only sections whose title matches (``re.search``)
+            where: Only sections for which ``where(title, level)`` is true
+            limit: Stop after this many matching sections
+
+        Returns:
+            Matching sections in document order
+
+        Examples:
+            >>> parser = MarkdownParser()
+            >>> sections = parser.select_sections_file(Path("article.md"), level=2, limit=1)
+        """
         content = path.read_text(encoding="utf-8")
-        return self.parse(content)
+        return self.select_sections(content, level, title_regex, where, limit)
+
+    def _check_line(self, limits: ParseLimits, line_num: int, line: str, deadline: float | None) -> str | None:
+        """Check per-line limits.
+
+        Args:
+            limits: Active limits
+            line_num: Index of the line about to be scanned
+            line: Line text
+            deadline: Monotonic deadline, None if no timeout
+
+        Returns:
+            Description of the exceeded limit, None if within limits
+        """
+        if limits.max_lines is not None and line_num >= limits.max_lines:
+            return f"more than {limits.max_lines} lines"
+        if limits.max_line_length is not None and len(line) > limits.max_line_length:
+            return f"line {line_num} exceeds {limits.max_line_length} characters"
+        # Reading the clock is the costliest check, so only do it periodically
+        if deadline is not None and not line_num & 0x3FF and time.monotonic() > deadline:
+            return f"parse exceeded {limits.timeout}s"
+        return None
+
+    def _limit_hit(self, reason: str) -> str:
+        """Handle an exceeded limit according to ``limits.on_limit``.
+
+        Args:
+            reason: Description of the exceeded limit
+
+        Returns:
+            The reason, for recording on a partial document
+
+        Raises:
+            MarkdownParseError: If ``limits.on_limit`` is "raise"
+        """
+        if self.limits is None or self.limits.on_limit == "raise":
+            raise MarkdownParseError(f"Parse limit exceeded: {reason}")
+        return reason
 
     def _finalize_section(self, section_data: dict) -> MarkdownSection:
         """Convert section data dict to MarkdownSection.
@@ -102,9 +391,157 @@ class MarkdownParser:
         if not isinstance(content_lines, list):
             content_lines = []
 
-        return MarkdownSection(
+        section = MarkdownSection(
             title=str(section_data["title"]),
             level=int(section_data["level"]),
             line_number=int(section_data["line_number"]),
             content="\n".join(content_lines),
         )
+        if self.section_store is not None:
+            self.section_store.add(section)
+        return section
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield lines lazily, matching ``content.split("\\n")``.
+
+    Args:
+        content: Text to split
+
+    Yields:
+        Each line without its newline
+    """
+    start = 0
+    while True:
+        end = content.find("\n", start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def _find_title(content: str) -> tuple[str | None, int | None]:
+    """Locate the first H1 line, as ``parse`` identifies the title.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        Title text and its line number, or (None, None) if there is no H1
+    """
+    for match in _TITLE_LINE.finditer(content):
+        end = content.find("\n", match.start())
+        stripped = content[match.start() : end if end != -1 else len(content)].strip()
+        if stripped.startswith("# "):
+            return stripped[2:].strip(), content.count("\n", 0, match.start())
+    return None, None
+
+
+def _chunk_bounds(content: str, chunk_count: int) -> list[int]:
+    """Split content into ranges that each start on a section heading line.
+
+    Args:
+        content: Markdown content
+        chunk_count: Desired number of ranges
+
+    Returns:
+        Increasing offsets, starting with 0 and ending with ``len(content)``
+    """
+    bounds = [0]
+    for k in range(1, chunk_count):
+        target = max(bounds[-1] + 1, len(content) * k // chunk_count)
+        for match in _SECTION_LINE.finditer(content, target):
+            end = content.find("\n", match.start())
+            if _section_heading(content[match.start() : end if end != -1 else len(content)].strip()):
+                bounds.append(match.start())
+                break
+        else:
+            break
+    bounds.append(len(content))
+    return bounds
+
+
+def _parse_chunk(chunk: str, first_line: int, title_line: int | None) -> list[tuple[str, int, int, str]]:
+    """Parse the sections of one range for ``parse_parallel``.
+
+    Sections are returned as plain tuples, which are much cheaper than
+    dataclass instances to send back from a worker process.
+
+    Args:
+        chunk: Range of the document, starting on a heading line (or at 0)
+        first_line: Line number of the range's first line in the document
+        title_line: Line number of the document's title H1, None if absent
+
+    Returns:
+        (title, level, line_number, content) per section, with document line numbers
+    """
+    sections: list[tuple[str, int, int, str]] = []
+    heading: tuple[str, int] | None = None
+    heading_line = 0
+    content_lines: list[str] = []
+
+    for line_num, line in enumerate(chunk.split("\n"), start=first_line):
+        if line_num == title_line:
+            continue
+
+        next_heading = _section_heading(line.strip())
+        if next_heading:
+            if heading:
+                sections.append((heading[0], heading[1], heading_line, "\n".join(content_lines)))
+            heading = next_heading
+            heading_line = line_num
+            content_lines = [line]
+        elif heading:
+            content_lines.append(line)
+
+    if heading:
+        sections.append((heading[0], heading[1], heading_line, "\n".join(content_lines)))
+
+    return sections
+
+
+def _decode_prefix(data: bytes) -> str:
+    """Decode a UTF-8 prefix that may end partway through a character.
+
+    Args:
+        data: Leading bytes of a UTF-8 file
+
+    Returns:
+        Decoded text, without any incomplete trailing character
+    """
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A character cut off by the size limit starts within the last 3 bytes
+        if e.start < len(data) - 3:
+            raise
+        return data[: e.start].decode("utf-8")
+
+
+def _heading_text(heading: str) -> str:
+    """Strip trailing whitespace and an ATX closing sequence from heading text.
+
+    Args:
+        heading: Text after the opening #s
+
+    Returns:
+        Heading title
+    """
+    return _CLOSING_HASHES.sub("", heading.rstrip())
+
+
+def _section_heading(stripped: str) -> tuple[str, int] | None:
+    """Return (title, level) if a stripped line starts a section.
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+
+    Returns:
+        Heading title and level, None if the line is not a section heading
+    """
+    if stripped.startswith("## "):
+        return stripped[3:].strip(), 2
+    if stripped.startswith("### "):
+        return stripped[4:].strip(), 3
+    return None
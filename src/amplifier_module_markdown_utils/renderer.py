@@ -0,0 +1,300 @@
+"""Streaming markdown-to-HTML rendering."""
+
+import html
+import io
+import re
+from collections.abc import Iterable
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from .links import _NESTED_IMAGE
+from .metadata import slugify
+from .models import MarkdownDocument
+from .parser import _FENCE_PATTERN
+from .parser import _HEADING_PATTERN
+from .parser import _heading_text
+from .parser import _iter_lines
+
+# Bracket text and titles stop at a newline, so an unclosed "[" costs one line of scanning
+_INLINE_PATTERN = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|!\[(?P<img_alt>[^\]\n]*)\]\((?P<img_src>[^)\s]+)(?:\s+\"(?P<img_title>[^\"\n]*)\")?\)"
+    rf"|\[(?P<link_text>(?>{_NESTED_IMAGE}|[^\]\n])*)\]\((?P<link_href>[^)\s]+)(?:\s+\"(?P<link_title>[^\"\n]*)\")?\)"
+)
+# Schemes that run script; browsers ignore control characters and whitespace inside them
+_SCRIPT_SCHEME = re.compile(r"(?:javascript|vbscript|data):", re.IGNORECASE)
+_IGNORED_URL_CHARS = re.compile(r"[\x00-\x20\x7f]")
+
+
+class HtmlRenderer:
+    """Renders markdown to HTML, writing each block to a text stream as it completes.
+
+    Supports ATX headings (with ``slugify`` anchors, de-duplicated as
+    ``slug-1``, ``slug-2``...), paragraphs, fenced code blocks, inline code,
+    images, links, and raw HTML lines such as inserted ``<img>`` tags, which
+    pass through unchanged unless ``escape_html`` is set. With ``escape_html``,
+    ``javascript:``, ``vbscript:`` and ``data:`` URLs in links (and all but
+    ``data:`` in images) are replaced with ``#``. Only the current paragraph
+    is buffered, so memory stays bounded by the largest block rather than
+    the document.
+
+    ``escape_html`` is not a sanitizer: it does not make output safe to
+    embed from untrusted sources without a dedicated HTML sanitizer.
+
+    Examples:
+        >>> renderer = HtmlRenderer()
+        >>> renderer.render_to_string(MarkdownParser().parse("# Title\\n\\nSee [docs](d.md)."))
+        '<h1 id="title">Title</h1>\\n<p>See <a href="d.md">docs</a>.</p>\\n'
+        >>> HtmlRenderer(escape_html=True).render_to_string(MarkdownParser().parse("<script>x</script>"))
+        '<p>&lt;script&gt;x&lt;/script&gt;</p>\\n'
+    """
+
+    def __init__(self, escape_html: bool = False):
+        """Create a renderer.
+
+        Args:
+            escape_html: Escape raw HTML lines instead of passing them through,
+                and replace script URLs in links and images with ``#``
+        """
+        self.escape_html = escape_html
+
+    def render(self, document: MarkdownDocument, out: TextIO) -> None:
+        """Render a parsed document from its title and sections.
+
+        The H1 and section headings come from the parsed model, so the HTML
+        has the same structure as the document. Only the lines before the
+        first section are read from ``raw_content``; section bodies are
+        rendered from each section's content.
+
+        Args:
+            document: Parsed markdown document
+            out: Text stream to write HTML to
+        """
+        writer = _BlockWriter(self, out)
+        sections = document.sections
+        title = document.title
+        preamble = _iter_lines(document.raw_content)
+        if sections:
+            preamble = islice(preamble, sections[0].line_number)
+
+        for line in preamble:
+            if title is not None and line.strip().startswith("# "):
+                # The parser's title line; inside a code block it stays code
+                if writer.in_code:
+                    writer.feed(line)
+                else:
+                    writer.heading(1, title)
+                title = None
+            else:
+                writer.feed(line)
+        if title is not None:
+            # The parser only takes the title from a line after the first section when the preamble has none
+            writer.heading(1, title)
+
+        for section in sections:
+            lines = _iter_lines(section.content)
+            heading_line = next(lines)
+            if writer.in_code:
+                writer.feed(heading_line)
+            else:
+                writer.heading(section.level, section.title)
+            for line in lines:
+                writer.feed(line, section_levels=False)
+        writer.close()
+
+    def render_file(self, path: Path, out: TextIO) -> None:
+        """Render a markdown file, reading it line by line.
+
+        Args:
+            path: Path to markdown file
+            out: Text stream to write HTML to
+
+        Examples:
+            >>> with open("article.html", "w", encoding="utf-8") as out:
+            ...     HtmlRenderer().render_file(Path("article.md"), out)
+        """
+        with path.open(encoding="utf-8", newline="") as f:
+            self.render_lines((line.rstrip("\r\n") for line in f), out)
+
+    def render_to_string(self, document: MarkdownDocument) -> str:
+        """Render a parsed document to an HTML string.
+
+        Args:
+            document: Parsed markdown document
+
+        Returns:
+            HTML markup
+        """
+        out = io.StringIO()
+        self.render(document, out)
+        return out.getvalue()
+
+    def render_lines(self, lines: Iterable[str], out: TextIO) -> None:
+        """Render unparsed markdown lines to HTML, detecting headings as it goes.
+
+        Args:
+            lines: Markdown lines without trailing newlines
+            out: Text stream to write HTML to
+        """
+        writer = _BlockWriter(self, out)
+        for line in lines:
+            writer.feed(line)
+        writer.close()
+
+    def _render_inline(self, text: str) -> str:
+        """Render inline code, images and links; escape everything else.
+
+        Args:
+            text: Inline markdown text
+
+        Returns:
+            HTML fragment
+        """
+        parts: list[str] = []
+        last = 0
+        for match in _INLINE_PATTERN.finditer(text):
+            parts.append(html.escape(text[last : match.start()], quote=False))
+            last = match.end()
+
+            if match.group("code") is not None:
+                parts.append(f"<code>{html.escape(match.group('code'), quote=False)}</code>")
+            elif match.group("img_src") is not None:
+                title = match.group("img_title")
+                title_attr = f' title="{html.escape(title)}"' if title else ""
+                parts.append(
+                    f'<img src="{html.escape(self._url(match.group("img_src"), image=True))}" '
+                    f'alt="{html.escape(match.group("img_alt"))}"{title_attr}>'
+                )
+            else:
+                title = match.group("link_title")
+                title_attr = f' title="{html.escape(title)}"' if title else ""
+                # Link text may hold an image (a linked badge), so render it as inline markdown too
+                parts.append(
+                    f'<a href="{html.escape(self._url(match.group("link_href")))}"{title_attr}>'
+                    f"{self._render_inline(match.group('link_text'))}</a>"
+                )
+        parts.append(html.escape(text[last:], quote=False))
+        return "".join(parts)
+
+    def _url(self, url: str, image: bool = False) -> str:
+        """Neutralize script URLs when escaping HTML.
+
+        Args:
+            url: Link href or image source
+            image: Whether the URL is an image source, where ``data:`` is allowed
+
+        Returns:
+            The URL, or ``#`` if it would run script
+        """
+        if not self.escape_html:
+            return url
+        scheme = _SCRIPT_SCHEME.match(_IGNORED_URL_CHARS.sub("", url))
+        if scheme and not (image and scheme.group().lower() == "data:"):
+            return "#"
+        return url
+
+    @staticmethod
+    def _unique_slug(title: str, slugs: dict[str, int]) -> str:
+        """Slugify a heading, suffixing repeats so anchors stay unique.
+
+        Args:
+            title: Heading text
+            slugs: Anchor ids used so far in this document, each mapped to
+                the last suffix tried for it
+
+        Returns:
+            Unique anchor id
+        """
+        base = slugify(title) or "section"
+        slug = base
+        # A suffixed id can collide with a heading that slugifies to it, as "A", "A", "a-1" would
+        while slug in slugs:
+            slugs[base] += 1
+            slug = f"{base}-{slugs[base]}"
+        slugs[slug] = 0
+        return slug
+
+
+class _BlockWriter:
+    """Block-level state for one rendered document: open paragraph, fence and anchors."""
+
+    def __init__(self, renderer: HtmlRenderer, out: TextIO):
+        self.renderer = renderer
+        self.out = out
+        self.paragraph: list[str] = []
+        self.fence: str | None = None
+        self.slugs: dict[str, int] = {}
+
+    @property
+    def in_code(self) -> bool:
+        """Whether a fenced code block is open."""
+        return self.fence is not None
+
+    def heading(self, level: int, title: str) -> None:
+        """Write a heading element.
+
+        Args:
+            level: Heading level (1-6)
+            title: Heading text, optionally with an ATX closing sequence
+        """
+        self.flush_paragraph()
+        title = _heading_text(title)
+        anchor = self.renderer._unique_slug(title, self.slugs)
+        self.out.write(f'<h{level} id="{anchor}">{self.renderer._render_inline(title)}</h{level}>\n')
+
+    def feed(self, line: str, section_levels: bool = True) -> None:
+        """Render one line.
+
+        Args:
+            line: Markdown line without its newline
+            section_levels: Whether ``##``/``###`` lines are headings; False when
+                the parsed sections already supply them
+        """
+        if self.fence is not None:
+            if line.strip().startswith(self.fence):
+                self.out.write("</code></pre>\n")
+                self.fence = None
+            else:
+                self.out.write(html.escape(line, quote=False) + "\n")
+            return
+
+        stripped = line.strip()
+        if not stripped:
+            self.flush_paragraph()
+            return
+
+        fence_match = _FENCE_PATTERN.match(stripped)
+        if fence_match:
+            self.flush_paragraph()
+            self.fence = fence_match.group("fence")
+            language = fence_match.group("info")
+            css_class = f' class="language-{html.escape(language)}"' if language else ""
+            self.out.write(f"<pre><code{css_class}>")
+            return
+
+        heading_match = _HEADING_PATTERN.match(stripped)
+        if heading_match:
+            level = len(heading_match.group("hashes"))
+            if section_levels or level not in (2, 3):
+                self.heading(level, heading_match.group("heading"))
+                return
+
+        if stripped.startswith("<") and not self.paragraph and not self.renderer.escape_html:
+            self.out.write(line + "\n")
+            return
+
+        self.paragraph.append(stripped)
+
+    def flush_paragraph(self) -> None:
+        """Write the buffered paragraph, if any."""
+        if self.paragraph:
+            text = "\n".join(self.paragraph)
+            self.out.write(f"<p>{self.renderer._render_inline(text)}</p>\n")
+            self.paragraph.clear()
+
+    def close(self) -> None:
+        """Flush the last block and close an unterminated fence."""
+        self.flush_paragraph()
+        if self.fence is not None:
+            self.out.write("</code></pre>\n")
@@ -0,0 +1,309 @@
+"""Parsed markdown corpus stored in shared memory for multiprocess workers."""
+
+import os
+import struct
+import sys
+from collections.abc import Iterator
+from collections.abc import Mapping
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+from .models import MarkdownDocument
+from .models import MarkdownParseError
+from .models import MarkdownSection
+
+# Buffer layout (little-endian):
+#   header:    magic, document count, section count, text blob offset, creator's tracker id
+#   documents: key, raw content, title (length -1 = None) spans; first section; section count;
+#              partial flag; limit reason span (length -1 = None)
+#   sections:  title span, level, line number, content span
+#   text blob: UTF-8 text referenced by the spans above
+_MAGIC = b"MDC3"
+_HEADER = struct.Struct("<4sqqqq")
+_DOCUMENT = struct.Struct("<qqqqqqqqqqq")
+_SECTION = struct.Struct("<qqqqqq")
+
+
+class SharedSection:
+    """Read-only, MarkdownSection-compatible view into a SharedCorpus.
+
+    Text attributes are decoded from shared memory on access; nothing is
+    copied or unpickled when the view is created.
+    """
+
+    __slots__ = ("_buf", "_title", "level", "line_number", "_content")
+
+    def __init__(self, buf: memoryview, record: tuple[int, ...]):
+        title_off, title_len, level, line_number, content_off, content_len = record
+        self._buf = buf
+        self._title = (title_off, title_len)
+        self.level = level
+        self.line_number = line_number
+        self._content = (content_off, content_len)
+
+    @property
+    def title(self) -> str:
+        """The heading text (without # markers)."""
+        return _decode(self._buf, *self._title)
+
+    @property
+    def content(self) -> str:
+        """Full content of the section including the heading."""
+        return _decode(self._buf, *self._content)
+
+    def to_section(self) -> MarkdownSection:
+        """Copy this view into a regular MarkdownSection."""
+        return MarkdownSection(self.title, self.level, self.line_number, self.content)
+
+    def __repr__(self) -> str:
+        return f"SharedSection(title={self.title!r}, level={self.level}, line_number={self.line_number})"
+
+
+class SharedDocument:
+    """Read-only, MarkdownDocument-compatible view into a SharedCorpus."""
+
+    __slots__ = ("_buf", "_record", "_sections_offset")
+
+    def __init__(self, buf: memoryview, record: tuple[int, ...], sections_offset: int):
+        self._buf = buf
+        self._record = record
+        self._sections_offset = sections_offset
+
+    @property
+    def title(self) -> str | None:
+        """Document title (first H1 heading), None if no H1 found."""
+        _, _, _, _, title_off, title_len, *_ = self._record
+        return None if title_len < 0 else _decode(self._buf, title_off, title_len)
+
+    @property
+    def raw_content(self) -> str:
+        """Original unparsed markdown content."""
+        _, _, raw_off, raw_len, *_ = self._record
+        return _decode(self._buf, raw_off, raw_len)
+
+    @property
+    def partial(self) -> bool:
+        """True if parsing stopped early at a ParseLimits limit."""
+        return bool(self._record[8])
+
+    @property
+    def limit_reason(self) -> str | None:
+        """Which limit stopped parsing, None for a complete parse."""
+        *_, reason_off, reason_len = self._record
+        return None if reason_len < 0 else _decode(self._buf, reason_off, reason_len)
+
+    @property
+    def sections(self) -> list[SharedSection]:
+        """Sections in the document."""
+        first, count = self._record[6:8]
+        start = self._sections_offset + first * _SECTION.size
+        return [
+            SharedSection(self._buf, _SECTION.unpack_from(self._buf, start + i * _SECTION.size)) for i in range(count)
+        ]
+
+    def to_document(self) -> MarkdownDocument:
+        """Copy this view into a regular MarkdownDocument."""
+        return MarkdownDocument(
+            title=self.title,
+            sections=[section.to_section() for section in self.sections],
+            raw_content=self.raw_content,
+            partial=self.partial,
+            limit_reason=self.limit_reason,
+        )
+
+
+class SharedCorpus:
+    """A parsed corpus in one flat shared-memory buffer.
+
+    The parent process parses once and calls ``create``; workers call
+    ``attach`` with the segment name and read documents through
+    ``SharedDocument`` views without copying the corpus. Section bodies
+    that are a contiguous slice of the raw content are stored only once.
+
+    Examples:
+        >>> parser = MarkdownParser()
+        >>> corpus = SharedCorpus.create({str(p): parser.parse_file(p) for p in paths})
+        >>> # in each worker, given corpus.name:
+        >>> worker_corpus = SharedCorpus.attach(name)
+        >>> worker_corpus["docs/intro.md"].sections[0].title
+        >>> worker_corpus.close()
+        >>> # in the parent, once workers are done:
+        >>> corpus.close()
+        >>> corpus.unlink()
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        buf = shm.buf
+        assert buf is not None  # None only after close()
+        self._buf = buf.toreadonly()
+
+        magic, document_count, section_count, _, self._tracker_id = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise MarkdownParseError(f"Shared memory segment {shm.name} is not a markdown corpus")
+        self._sections_offset = _HEADER.size + document_count * _DOCUMENT.size
+        self._records: dict[str, tuple[int, ...]] = {}
+        for i in range(document_count):
+            record = _DOCUMENT.unpack_from(self._buf, _HEADER.size + i * _DOCUMENT.size)
+            self._records[_decode(self._buf, record[0], record[1])] = record
+        self.section_count = section_count
+
+    @classmethod
+    def create(cls, documents: Mapping[str, MarkdownDocument], name: str | None = None) -> "SharedCorpus":
+        """Write parsed documents into a new shared-memory segment.
+
+        Args:
+            documents: Parsed documents keyed by name (e.g. file path)
+            name: Optional segment name (default: generated)
+
+        Returns:
+            Corpus owning the segment; call ``unlink`` when workers are done
+        """
+        blob = bytearray()
+        document_records: list[tuple[int, ...]] = []
+        section_records: list[tuple[int, ...]] = []
+
+        def add_text(text: str) -> tuple[int, int]:
+            encoded = text.encode("utf-8")
+            blob.extend(encoded)
+            return len(blob) - len(encoded), len(encoded)
+
+        for key, document in documents.items():
+            key_span = add_text(key)
+            raw_off, raw_len = add_text(document.raw_content)
+            title_span = add_text(document.title) if document.title is not None else (0, -1)
+            reason_span = add_text(document.limit_reason) if document.limit_reason is not None else (0, -1)
+            raw = blob[raw_off : raw_off + raw_len]
+            line_starts = _line_starts(raw)
+
+            first_section = len(section_records)
+            for section in document.sections:
+                content = section.content.encode("utf-8")
+                start = line_starts[section.line_number] if section.line_number < len(line_starts) else raw_len
+                if raw[start : start + len(content)] == content:
+                    content_span = (raw_off + start, len(content))
+                else:
+                    content_span = add_text(section.content)
+                section_records.append((*add_text(section.title), section.level, section.line_number, *content_span))
+            document_records.append(
+                (
+                    *key_span,
+                    raw_off,
+                    raw_len,
+                    *title_span,
+                    first_section,
+                    len(section_records) - first_section,
+                    int(document.partial),
+                    *reason_span,
+                )
+            )
+
+        blob_offset = _HEADER.size + len(document_records) * _DOCUMENT.size + len(section_records) * _SECTION.size
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, blob_offset + len(blob)))
+        buf = shm.buf
+        assert buf is not None
+        _HEADER.pack_into(buf, 0, _MAGIC, len(document_records), len(section_records), blob_offset, _tracker_id())
+        offset = _HEADER.size
+        for record in document_records:
+            _DOCUMENT.pack_into(buf, offset, *_shift(record, blob_offset, (0, 2, 4, 9)))
+            offset += _DOCUMENT.size
+        for record in section_records:
+            _SECTION.pack_into(buf, offset, *_shift(record, blob_offset, (0, 4)))
+            offset += _SECTION.size
+        buf[blob_offset : blob_offset + len(blob)] = blob
+        del buf
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCorpus":
+        """Attach read-only to a corpus created by another process.
+
+        Args:
+            name: Segment name from ``SharedCorpus.name``
+
+        Returns:
+            Corpus view; call ``close`` when finished
+
+        Raises:
+            MarkdownParseError: If the segment does not hold a corpus
+        """
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name=name, track=False), owner=False)
+
+        shm = shared_memory.SharedMemory(name=name)
+        corpus = cls(shm, owner=False)
+        # Attaching registered the segment with this process's resource tracker, which would
+        # unlink it at exit; only the creator should. Children started by the creator share
+        # its tracker, where unregistering would drop the creator's own registration instead
+        if os.name == "posix" and corpus._tracker_id != _tracker_id():
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return corpus
+
+    @property
+    def name(self) -> str:
+        """Shared-memory segment name for ``attach``."""
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __getitem__(self, key: str) -> SharedDocument:
+        return SharedDocument(self._buf, self._records[key], self._sections_offset)
+
+    def close(self) -> None:
+        """Detach from the segment. Views from this corpus become invalid."""
+        self._buf.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment. Only the creating process should call this."""
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedCorpus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        self.unlink()
+
+
+def _tracker_id() -> int:
+    """Identify this process's resource tracker by the inode of its pipe (0 if none)."""
+    fd = resource_tracker._resource_tracker._fd  # type: ignore[attr-defined]
+    if fd is None:
+        return 0
+    try:
+        return os.fstat(fd).st_ino
+    except OSError:
+        return 0
+
+
+def _decode(buf: memoryview, offset: int, length: int) -> str:
+    return str(buf[offset : offset + length], "utf-8")
+
+
+def _line_starts(raw: bytes | bytearray) -> list[int]:
+    """Byte offset of the start of each line."""
+    starts = [0]
+    position = raw.find(b"\n")
+    while position != -1:
+        starts.append(position + 1)
+        position = raw.find(b"\n", position + 1)
+    return starts
+
+
+def _shift(record: tuple[int, ...], blob_offset: int, fields: tuple[int, ...]) -> list[int]:
+    """Rebase blob-relative offsets in a record to absolute buffer offsets."""
+    values = list(record)
+    for i in fields:
+        values[i] += blob_offset
+    return values
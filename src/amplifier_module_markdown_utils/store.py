@@ -0,0 +1,185 @@
+"""Content-addressed store for sharing identical section text across documents."""
+
+import sys
+import threading
+from dataclasses import dataclass
+
+from .models import MarkdownError
+from .models import MarkdownSection
+
+
+def _refcounts(strings: dict[str, str]) -> list[int]:
+    """Reference count of each stored string, measured the same way for every caller."""
+    return [sys.getrefcount(content) for content in strings]
+
+
+def _calibrate_unused_refcount() -> int | None:
+    """Measure the reference count ``_refcounts`` reports for a string nobody else uses.
+
+    The value is an interpreter detail (it changes when references are
+    borrowed rather than counted), so it is measured rather than assumed.
+
+    Returns:
+        The count, or None if reference counts cannot tell whether a string is in use
+    """
+    if sys.implementation.name != "cpython":
+        return None
+    probe = "".join(["section ", "probe"])
+    strings = {probe: probe}
+    del probe
+    (unused,) = _refcounts(strings)
+    held = next(iter(strings))
+    (used,) = _refcounts(strings)
+    del held
+    return unused if used == unused + 1 else None
+
+
+_UNUSED_REFCOUNT = _calibrate_unused_refcount()
+
+
+@dataclass
+class SectionStoreStats:
+    """Deduplication statistics for a SectionStore.
+
+    Byte counts are ``sys.getsizeof`` sizes, so they can be compared with
+    the memory the same sections would use without the store.
+
+    Attributes:
+        unique_sections: Number of distinct section bodies held
+        references: Number of live references to those bodies outside the store
+        unique_bytes: Memory of the distinct section bodies
+        referenced_bytes: Memory the referenced bodies would use if each reference had its own copy
+        overhead_bytes: Memory of the store's own index
+
+    Example:
+        >>> stats = SectionStoreStats(1, 4, unique_bytes=100, referenced_bytes=400, overhead_bytes=100)
+        >>> stats.dedup_ratio
+        2.0
+    """
+
+    unique_sections: int
+    references: int
+    unique_bytes: int
+    referenced_bytes: int
+    overhead_bytes: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Memory without the store divided by memory with it (> 1.0 means savings)."""
+        if not self.referenced_bytes:
+            return 1.0
+        return self.referenced_bytes / (self.unique_bytes + self.overhead_bytes)
+
+    @property
+    def saved_bytes(self) -> int:
+        """Memory saved by sharing, net of the store's overhead (negative if it costs memory)."""
+        return self.referenced_bytes - self.unique_bytes - self.overhead_bytes
+
+
+class SectionStore:
+    """Shared, content-addressed store for section bodies.
+
+    Sections added to the store have their ``content`` replaced by a single
+    canonical string shared by every section with identical text. The store
+    keeps no per-section bookkeeping: liveness is read from each canonical
+    string's reference count, and bodies no longer used by any section are
+    evicted by ``evict``, which also runs automatically whenever the store
+    has doubled in size since the last sweep. Bodies shorter than
+    ``min_length`` are left alone, since an index entry would cost about as
+    much as the text it could share. Safe to share between threads and parsers.
+
+    Examples:
+        >>> store = SectionStore()
+        >>> parser = MarkdownParser(section_store=store)
+        >>> docs = [parser.parse(text) for text in corpus]
+        >>> store.stats().dedup_ratio
+    """
+
+    def __init__(self, min_length: int = 64):
+        """Create an empty store.
+
+        Args:
+            min_length: Shortest section body, in characters, worth sharing
+
+        Raises:
+            MarkdownError: If this interpreter's reference counts cannot track section lifetimes
+        """
+        if _UNUSED_REFCOUNT is None:
+            raise MarkdownError("SectionStore requires CPython reference counting to track section lifetimes")
+        self._unused_refcount = _UNUSED_REFCOUNT
+        self.min_length = min_length
+        self._strings: dict[str, str] = {}
+        self._sweep_at = 1024
+        self._lock = threading.Lock()
+
+    def add(self, section: MarkdownSection) -> MarkdownSection:
+        """Replace a section's content with the shared copy.
+
+        Args:
+            section: Section whose content should be shared
+
+        Returns:
+            The same section, with ``content`` pointing at the shared string
+        """
+        if len(section.content) < self.min_length:
+            return section
+        with self._lock:
+            content = self._strings.get(section.content)
+            if content is None:
+                content = self._strings[section.content] = section.content
+                if len(self._strings) >= self._sweep_at:
+                    self._evict()
+                    self._sweep_at = max(1024, 2 * len(self._strings))
+        section.content = content
+        return section
+
+    def evict(self) -> int:
+        """Drop bodies no longer referenced outside the store.
+
+        Returns:
+            Number of bodies evicted
+        """
+        with self._lock:
+            return self._evict()
+
+    def stats(self) -> SectionStoreStats:
+        """Evict unused bodies and return current deduplication statistics.
+
+        Returns:
+            Snapshot of store size, sharing and overhead
+        """
+        with self._lock:
+            self._evict()
+            references = 0
+            unique_bytes = 0
+            referenced_bytes = 0
+            for content, refcount in zip(self._strings, _refcounts(self._strings)):
+                count = refcount - self._unused_refcount
+                size = sys.getsizeof(content)
+                references += count
+                unique_bytes += size
+                referenced_bytes += size * count
+            return SectionStoreStats(
+                unique_sections=len(self._strings),
+                references=references,
+                unique_bytes=unique_bytes,
+                referenced_bytes=referenced_bytes,
+                overhead_bytes=sys.getsizeof(self._strings),
+            )
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, content: object) -> bool:
+        return content in self._strings
+
+    def _evict(self) -> int:
+        """Evict unreferenced bodies; the caller holds the lock."""
+        refcounts = _refcounts(self._strings)
+        unused = [content for content, refcount in zip(self._strings, refcounts) if refcount <= self._unused_refcount]
+        for content in unused:
+            del self._strings[content]
+        if unused:
+            # dict never shrinks in place; rebuild so evicted slots are freed
+            self._strings = dict(self._strings)
+        return len(unused)
@@ -2,6 +2,11 @@
 
 from pathlib import Path
 
+from .line_index import LineIndex
+from .line_index import _LineCursor
+from .links import LinkInventory
+from .links import extract_links
+
 
 class MarkdownImageUpdater:
     """Updates markdown files by inserting images at specified locations."""
@@ -14,6 +19,9 @@ class MarkdownImageUpdater:
         alt_text: str = "",
         width: str | None = "50%",
         placement: str = "at_line",
+        if_absent: bool = False,
+        inventory: LinkInventory | None = None,
+        line_index: LineIndex | None = None,
     ) -> str:
         """Insert an image into markdown content.
 
@@ -24,6 +32,13 @@ class MarkdownImageUpdater:
             alt_text: Alt text for image
             width: Optional width attribute (HTML img tag)
             placement: Insertion strategy - "at_line", "before_section", "after_intro"
+            if_absent: Skip insertion if the content already shows this image
+            inventory: Precomputed inventory of the content for ``if_absent``
+                checks; updated in place when an image is inserted, so it can
+                be reused across successive calls
+            line_index: Precomputed index of ``content`` (e.g. ``doc.line_index``);
+                ignored if it indexes different content. Without one, only the
+                lines up to the insertion point are scanned
 
         Returns:
             Updated markdown content
@@ -34,17 +49,40 @@ class MarkdownImageUpdater:
             >>> updated = updater.insert_image(content, 4, "images/pic.png", "My pic")
             >>> "img src" in updated
             True
+            >>> updater.insert_image(updated, 4, "images/pic.png", if_absent=True) == updated
+            True
         """
-        lines = content.split("\n")
+        if if_absent:
+            if inventory is None:
+                inventory = extract_links(content)
+            if inventory.has_image(image_path):
+                return content
+
+        if line_index is not None and line_index.content is not content:
+            line_index = None
+
+        # If no target specified, use middle of document
+        if line_number is None:
+            line_count = line_index.line_count if line_index is not None else content.count("\n") + 1
+            line_number = line_count // 2
+
+        lines: LineIndex | _LineCursor
+        if line_index is not None:
+            lines = line_index
+        else:
+            # A one-off insert only needs the lines from the search window on
+            lines = _LineCursor(content, line_number - 5 if placement == "before_section" else line_number)
 
         image_markdown = self._create_image_markdown(image_path, alt_text, width)
 
         insert_line = self._find_insertion_line(lines, line_number, placement)
 
-        if 0 <= insert_line <= len(lines):
-            lines.insert(insert_line, image_markdown)
+        if insert_line >= 0:
+            content = lines.insert_at_line(insert_line, image_markdown)
+            if inventory is not None:
+                inventory.image_targets.add(image_path)
 
-        return "\n".join(lines)
+        return content
 
     def insert_image_in_file(
         self,
@@ -55,6 +93,7 @@ class MarkdownImageUpdater:
         alt_text: str = "",
         width: str | None = "50%",
         placement: str = "at_line",
+        if_absent: bool = False,
     ) -> None:
         """Insert an image into a markdown file.
 
@@ -66,6 +105,7 @@ class MarkdownImageUpdater:
             alt_text: Alt text for image
             width: Optional width attribute
             placement: Insertion strategy
+            if_absent: Skip insertion if the file already shows this image
 
         Examples:
             >>> updater = MarkdownImageUpdater()
@@ -78,7 +118,7 @@ class MarkdownImageUpdater:
             ... )
         """
         content = input_path.read_text(encoding="utf-8")
-        updated = self.insert_image(content, line_number, image_path, alt_text, width, placement)
+        updated = self.insert_image(content, line_number, image_path, alt_text, width, placement, if_absent)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(updated, encoding="utf-8")
 
@@ -97,29 +137,25 @@ class MarkdownImageUpdater:
             return f'\n<img src="{image_path}" alt="{alt_text}" width="{width}">\n'
         return f"\n![{alt_text}]({image_path})\n"
 
-    def _find_insertion_line(self, lines: list[str], target: int | None, placement: str) -> int:
+    def _find_insertion_line(self, lines: LineIndex | _LineCursor, target: int, placement: str) -> int:
         """Find the best line to insert content.
 
         Args:
-            lines: Content lines
-            target: Target line number (None = auto-determine)
+            lines: Line index of the content, or a cursor at the search window
+            target: Target line number
             placement: Insertion strategy
 
         Returns:
-            Line index for insertion
+            Line index for insertion; past the last line means append
         """
-        # If no target specified, use middle of document
-        if target is None:
-            target = len(lines) // 2
-
         if placement == "before_section":
-            for i in range(max(0, target - 5), min(len(lines), target + 5)):
-                if i < len(lines) and lines[i].startswith("##"):
+            for i, line in enumerate(lines.lines(target - 5, target + 5), start=max(0, target - 5)):
+                if line.startswith("##"):
                     return i
 
         elif placement == "after_intro":
-            for i in range(target, min(len(lines), target + 20)):
-                if i < len(lines) and not lines[i].strip() and i > target:
+            for i, line in enumerate(lines.lines(target + 1, target + 20), start=max(0, target + 1)):
+                if not line.strip():
                     return i + 1
 
-        return min(target, len(lines))
+        return target
@@ -0,0 +1,239 @@
+"""Tests for manifest-driven batch image insertion."""
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+import pytest
+from amplifier_module_markdown_utils import FileInsertResult
+from amplifier_module_markdown_utils import ImageInsertion
+from amplifier_module_markdown_utils import MarkdownImageUpdater
+from amplifier_module_markdown_utils import MarkdownInsertError
+from amplifier_module_markdown_utils import apply_manifest
+from amplifier_module_markdown_utils import load_manifest
+from amplifier_module_markdown_utils.batch import main
+
+
+class TestLoadManifest:
+    """Tests for load_manifest function."""
+
+    def test_loads_specs_relative_to_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "manifest.jsonl"
+            manifest.write_text(
+                json.dumps({"path": "a.md", "image_path": "images/a.png", "line_number": 2})
+                + "\n\n"
+                + json.dumps({"path": "b.md", "image_path": "images/b.png", "width": None, "output_path": "out/b.md"})
+                + "\n",
+                encoding="utf-8",
+            )
+
+            specs = load_manifest(manifest)
+
+            assert len(specs) == 2
+            assert specs[0].path == Path(tmp) / "a.md"
+            assert specs[0].line_number == 2
+            assert specs[0].width == "50%"
+            assert specs[1].width is None
+            assert specs[1].output_path == Path(tmp) / "out" / "b.md"
+
+    def test_rejects_invalid_entry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "manifest.jsonl"
+            manifest.write_text('{"path": "a.md"}\n', encoding="utf-8")
+
+            with pytest.raises(MarkdownInsertError, match="manifest.jsonl:1"):
+                load_manifest(manifest)
+
+    def test_rejects_wrong_field_types(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "manifest.jsonl"
+            for entry, message in [
+                ({"path": "a.md", "image_path": "a.png", "line_number": "3"}, "line_number must be int"),
+                ({"path": "a.md", "image_path": "a.png", "line_number": True}, "line_number must be int"),
+                ({"path": "a.md", "image_path": 5}, "image_path must be str"),
+                ({"path": "a.md", "image_path": "a.png", "placement": "middle"}, "placement must be one of"),
+                ([1, 2], "expected a JSON object"),
+            ]:
+                manifest.write_text("\n" + json.dumps(entry) + "\n", encoding="utf-8")
+
+                with pytest.raises(MarkdownInsertError, match=f"manifest.jsonl:2: .*{message}"):
+                    load_manifest(manifest)
+
+
+class TestApplyManifest:
+    """Tests for apply_manifest function."""
+
+    def test_groups_inserts_by_file(self):
+        content = "# Title\n\nLine 1\nLine 2\nLine 3"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text(content, encoding="utf-8")
+            specs = [
+                ImageInsertion(path, "images/one.png", "One", line_number=2),
+                ImageInsertion(path, "images/two.png", "Two", line_number=3),
+            ]
+
+            results = apply_manifest(specs)
+
+            updater = MarkdownImageUpdater()
+            expected = updater.insert_image(content, 2, "images/one.png", "One")
+            expected = updater.insert_image(expected, 3, "images/two.png", "Two")
+            assert results == [FileInsertResult(path, path, inserted=2, changed=True, written=True)]
+            assert path.read_text(encoding="utf-8") == expected
+            assert list(Path(tmp).iterdir()) == [path]
+
+    def test_processes_multiple_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"doc{i}.md" for i in range(5)]
+            for path in paths:
+                path.write_text("# Title\n\nContent", encoding="utf-8")
+
+            results = apply_manifest([ImageInsertion(p, "images/pic.png", line_number=2) for p in paths], max_workers=3)
+
+            assert [r.path for r in results] == paths
+            assert all(r.ok and r.written for r in results)
+            assert all("images/pic.png" in p.read_text(encoding="utf-8") for p in paths)
+
+    def test_if_absent_skips_existing_images(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text("# Title\n\n![Old](images/old.png)\n\nContent", encoding="utf-8")
+            specs = [
+                ImageInsertion(path, "images/old.png", line_number=2, if_absent=True),
+                ImageInsertion(path, "images/new.png", line_number=2, if_absent=True),
+                ImageInsertion(path, "images/new.png", line_number=4, if_absent=True),
+            ]
+
+            results = apply_manifest(specs)
+
+            assert results[0].inserted == 1
+            assert results[0].skipped == 2
+            assert path.read_text(encoding="utf-8").count("images/new.png") == 1
+
+    def test_dry_run_does_not_write(self):
+        content = "# Title\n\nContent"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text(content, encoding="utf-8")
+
+            results = apply_manifest([ImageInsertion(path, "images/pic.png", line_number=2)], dry_run=True)
+
+            assert results[0].changed
+            assert not results[0].written
+            assert path.read_text(encoding="utf-8") == content
+
+    def test_writes_to_output_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            output = Path(tmp) / "out" / "article.md"
+            path.write_text("# Title\n\nContent", encoding="utf-8")
+
+            results = apply_manifest([ImageInsertion(path, "images/pic.png", line_number=2, output_path=output)])
+
+            assert results[0].output_path == output
+            assert "images/pic.png" in output.read_text(encoding="utf-8")
+            assert "images/pic.png" not in path.read_text(encoding="utf-8")
+
+    def test_preserves_file_mode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text("# Title\n\nContent", encoding="utf-8")
+            path.chmod(0o664)
+            output = Path(tmp) / "out" / "new.md"
+
+            umask = os.umask(0o027)
+            try:
+                apply_manifest(
+                    [
+                        ImageInsertion(path, "images/pic.png", line_number=2),
+                        ImageInsertion(path, "b.png", output_path=output),
+                    ]
+                )
+            finally:
+                os.umask(umask)
+
+            assert stat.S_IMODE(path.stat().st_mode) == 0o664
+            assert stat.S_IMODE(output.stat().st_mode) == 0o640
+            assert [p.name for p in output.parent.iterdir()] == ["new.md"]
+
+    def test_groups_aliased_paths(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "docs" / "a.md"
+            path.parent.mkdir()
+            path.write_text("# Title\n\nContent", encoding="utf-8")
+            alias = Path(tmp) / "docs" / ".." / "docs" / "a.md"
+
+            results = apply_manifest([ImageInsertion(path, "one.png"), ImageInsertion(alias, "two.png")])
+
+            assert len(results) == 1
+            assert results[0].inserted == 2
+            content = path.read_text(encoding="utf-8")
+            assert "one.png" in content and "two.png" in content
+
+    def test_rejects_two_inputs_for_one_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "out.md"
+            specs = [
+                ImageInsertion(Path(tmp) / "a.md", "a.png", output_path=output),
+                ImageInsertion(Path(tmp) / "b.md", "b.png", output_path=output),
+            ]
+
+            with pytest.raises(MarkdownInsertError, match="output of both"):
+                apply_manifest(specs)
+
+    def test_reports_bad_spec_types_per_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bad = Path(tmp) / "bad.md"
+            good = Path(tmp) / "good.md"
+            for path in (bad, good):
+                path.write_text("# Title\n\nContent", encoding="utf-8")
+
+            results = apply_manifest(
+                [ImageInsertion(bad, "a.png", line_number="3"), ImageInsertion(good, "b.png")]  # type: ignore[arg-type]
+            )
+
+            assert not results[0].ok
+            assert results[1].ok and results[1].written
+
+    def test_reports_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            good = Path(tmp) / "good.md"
+            good.write_text("# Title", encoding="utf-8")
+            missing = Path(tmp) / "missing.md"
+
+            results = apply_manifest([ImageInsertion(missing, "a.png"), ImageInsertion(good, "b.png")])
+
+            assert not results[0].ok
+            assert not results[0].written
+            assert results[1].ok
+
+
+class TestMain:
+    """Tests for the batch command-line entry point."""
+
+    def test_reports_invalid_manifest(self, capsys):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "manifest.jsonl"
+            manifest.write_text(
+                json.dumps({"path": "a.md", "image_path": "a.png", "line_number": "3"}), encoding="utf-8"
+            )
+
+            assert main([str(manifest)]) == 2
+            assert "manifest.jsonl:1" in capsys.readouterr().err
+
+    def test_applies_manifest(self, capsys):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text("# Title\n\nContent", encoding="utf-8")
+            manifest = Path(tmp) / "manifest.jsonl"
+            manifest.write_text(json.dumps({"path": "article.md", "image_path": "images/pic.png"}), encoding="utf-8")
+
+            assert main([str(manifest), "--dry-run"]) == 0
+            assert "would insert 1" in capsys.readouterr().out
+            assert "images/pic.png" not in path.read_text(encoding="utf-8")
+
+            assert main([str(manifest)]) == 0
+            assert "images/pic.png" in path.read_text(encoding="utf-8")
@@ -0,0 +1,129 @@
+"""Tests for editable markdown buffer."""
+
+import random
+
+import pytest
+from amplifier_module_markdown_utils import EditableMarkdown
+from amplifier_module_markdown_utils import MarkdownImageUpdater
+from amplifier_module_markdown_utils import MarkdownInsertError
+from amplifier_module_markdown_utils import MarkdownParser
+
+CONTENT = "# Title\n\nIntro\n\n## First\n\nFirst text\n\n## Second\n\nSecond text\n\n### Sub\n\nSub text"
+
+
+class TestEditableMarkdown:
+    """Tests for EditableMarkdown class."""
+
+    def test_renders_unchanged_content(self):
+        editable = EditableMarkdown(MarkdownParser().parse(CONTENT))
+
+        assert editable.render() == CONTENT
+        assert editable.line_count == len(CONTENT.split("\n"))
+        assert editable.title == "Title"
+
+    def test_handles_empty_content(self):
+        editable = EditableMarkdown.from_text("")
+
+        assert editable.render() == ""
+        editable.insert_lines(0, "Hello")
+        assert editable.render() == "Hello\n"
+
+    def test_deleting_every_line_leaves_empty_line(self):
+        editable = EditableMarkdown.from_text("a\nb")
+
+        editable.delete_lines(0, 2)
+
+        assert editable.render() == ""
+        assert editable.line_count == 1
+        editable.insert_image(None, "images/pic.png")
+        assert editable.render() == MarkdownImageUpdater().insert_image("", None, "images/pic.png")
+
+    def test_insert_image_matches_updater(self):
+        updater = MarkdownImageUpdater()
+        editable = EditableMarkdown.from_text(CONTENT)
+        expected = CONTENT
+
+        for i, line_number in enumerate([2, 0, 9, 100, None, 5]):
+            editable.insert_image(line_number, f"images/{i}.png", f"Image {i}")
+            expected = updater.insert_image(expected, line_number, f"images/{i}.png", f"Image {i}")
+
+        assert editable.render() == expected
+
+    def test_tracks_sections_across_edits(self):
+        editable = EditableMarkdown.from_text(CONTENT)
+
+        assert editable.section_line("Second") == 8
+        editable.insert_lines(1, "a\nb")
+        assert editable.section_line("Second") == 10
+        editable.delete_lines(0, 3)
+        assert editable.section_line("Second") == 7
+        assert editable.get_line(7) == "## Second"
+
+    def test_insert_before_and_after_section(self):
+        editable = EditableMarkdown.from_text(CONTENT)
+
+        editable.insert_after_section("First", "AFTER")
+        editable.insert_before_section("Second", "BEFORE")
+        editable.insert_after_section("Sub", "END")
+
+        lines = editable.render().split("\n")
+        assert lines.index("BEFORE") < lines.index("## Second")
+        assert lines.index("AFTER") < lines.index("BEFORE")
+        assert lines.index("AFTER") > lines.index("First text")
+        assert lines[-1] == "END"
+
+    def test_finds_sections_in_inserted_text(self):
+        editable = EditableMarkdown.from_text(CONTENT)
+
+        editable.insert_lines(3, "## Inserted\n\nNew text")
+
+        assert editable.section_line("Inserted") == 3
+        editable.insert_after_section("Inserted", "TAIL")
+        assert editable.get_line(7) == "TAIL"
+        assert editable.get_line(8) == "## First"
+        assert [s.title for s in editable.to_document().sections] == ["Inserted", "First", "Second", "Sub"]
+
+    def test_deleted_section_is_not_found(self):
+        editable = EditableMarkdown.from_text(CONTENT)
+
+        editable.delete_lines(8, 1)
+
+        assert editable.section_line("Second") is None
+        with pytest.raises(MarkdownInsertError):
+            editable.insert_before_section("Second", "x")
+
+    def test_rejects_out_of_range(self):
+        editable = EditableMarkdown.from_text("a\nb")
+
+        with pytest.raises(MarkdownInsertError):
+            editable.insert_lines(3, "x")
+        with pytest.raises(MarkdownInsertError):
+            editable.delete_lines(1, 2)
+        with pytest.raises(MarkdownInsertError):
+            editable.get_line(2)
+
+    def test_random_edits_match_list_model(self):
+        rng = random.Random(0)
+        editable = EditableMarkdown.from_text(CONTENT)
+        model: list[str] = list(CONTENT.split("\n"))
+
+        for i in range(300):
+            if model and rng.random() < 0.4:
+                start = rng.randrange(len(model))
+                count = rng.randint(0, min(3, len(model) - start))
+                editable.delete_lines(start, count)
+                del model[start : start + count]
+                model = model or [""]
+            else:
+                position = rng.randint(0, len(model))
+                text = rng.choice([f"line {i}", f"## Heading {i}", f"x{i}\ny{i}"])
+                editable.insert_lines(position, text)
+                model[position:position] = text.split("\n")
+
+            assert editable.line_count == len(model)
+
+        assert editable.render() == "\n".join(model)
+        for i, line in enumerate(model):
+            assert editable.get_line(i) == line
+            if line.startswith("## "):
+                assert editable.section_line(line[3:]) == i
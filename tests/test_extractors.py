@@ -0,0 +1,221 @@
+"""Tests for extraction pipeline."""
+
+import re
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from amplifier_module_markdown_utils import DocumentStats
+from amplifier_module_markdown_utils import ExtractionPipeline
+from amplifier_module_markdown_utils import Extractor
+from amplifier_module_markdown_utils import Heading
+from amplifier_module_markdown_utils import LineExtractor
+from amplifier_module_markdown_utils import TokenExtractor
+from amplifier_module_markdown_utils import extract_links
+from amplifier_module_markdown_utils import extract_title
+from amplifier_module_markdown_utils import extractors
+from amplifier_module_markdown_utils.extractors import HeadingsExtractor
+from amplifier_module_markdown_utils.extractors import LinksExtractor
+from amplifier_module_markdown_utils.extractors import StatsExtractor
+from amplifier_module_markdown_utils.extractors import TitleExtractor
+
+CONTENT = """---
+author: Jane
+tags: "docs"
+---
+# Guide
+
+Read [the docs](docs.md) first.
+
+## Install
+
+```bash
+# not a heading
+pip install thing
+```
+
+![Diagram](images/d.png)
+
+### Notes ###
+
+Done."""
+
+
+class CountingExtractor(LineExtractor):
+    name = "calls"
+
+    def __init__(self):
+        self.calls = 0
+
+    def feed(self, line, line_number, offset, in_code):
+        self.calls += 1
+
+    def result(self):
+        return self.calls
+
+
+class TestExtractionPipeline:
+    """Tests for ExtractionPipeline class."""
+
+    def test_extracts_defaults(self):
+        result = ExtractionPipeline().run(CONTENT)
+
+        assert result.title == "Guide" == extract_title(CONTENT)
+        assert result.headings == [
+            Heading("Guide", 1, 4),
+            Heading("Install", 2, 8),
+            Heading("Notes", 3, 17),
+        ]
+        assert result.frontmatter == {"author": "Jane", "tags": "docs"}
+        assert result.links == extract_links(CONTENT)
+
+        lines = CONTENT.split("\n")
+        assert result.stats == DocumentStats(
+            lines=len(lines),
+            words=len(CONTENT.split()),
+            characters=sum(len(line) for line in lines),
+            reading_time_minutes=len(CONTENT.split()) / 200,
+        )
+
+    def test_custom_extractor_sees_every_line_once(self):
+        pipeline = ExtractionPipeline([TitleExtractor])
+        pipeline.register(CountingExtractor)
+
+        result = pipeline.run(CONTENT)
+
+        assert result["calls"] == len(CONTENT.split("\n"))
+        assert result.title == "Guide"
+        assert result.get("stats") is None
+        assert result.stats is None
+
+    def test_passes_line_offsets_and_code_flags(self):
+        seen = []
+
+        class Recorder(LineExtractor):
+            name = "recorder"
+
+            def feed(self, line, line_number, offset, in_code):
+                seen.append((line, offset, in_code))
+
+            def result(self):
+                return None
+
+        content = "a\n```\ncode\n```\nb"
+        ExtractionPipeline([Recorder]).run(content)
+
+        assert seen == [("a", 0, False), ("```", 2, True), ("code", 6, True), ("```", 11, True), ("b", 15, False)]
+        assert all(content[offset : offset + len(line)] == line for line, offset, _ in seen)
+
+    def test_line_extractors_share_one_scan(self):
+        pipeline = ExtractionPipeline([CountingExtractor, CountingExtractor])
+
+        result = pipeline.run("a\nb")
+
+        assert result["calls"] == 2
+        assert CountingExtractor().extract("a\nb\nc") == 3
+
+    def test_token_extractors_share_one_scan(self, monkeypatch):
+        events = []
+
+        class Recorder(TokenExtractor):
+            name = "recorder"
+
+            def feed_heading(self, heading, line, in_code):
+                events.append((heading.title, line, in_code))
+
+            def feed_link(self, ref):
+                events.append((ref.kind, ref.target))
+
+            def result(self):
+                return len(events)
+
+        content = "# [Home](index.md)\n```\n# code [x](y)\n```\n## Next ##\n![img](a.png)"
+        scans = []
+        scan_tokens = extractors._scan_tokens
+        monkeypatch.setattr(extractors, "_scan_tokens", lambda *args: scans.append(scan_tokens(*args)))
+
+        result = ExtractionPipeline([TitleExtractor, HeadingsExtractor, LinksExtractor, Recorder]).run(content)
+
+        assert len(scans) == 1
+        assert events == [
+            ("[Home](index.md)", "# [Home](index.md)", False),
+            ("link", "index.md"),
+            ("code [x](y)", "# code [x](y)", True),
+            ("link", "y"),
+            ("Next", "## Next ##", False),
+            ("image", "a.png"),
+        ]
+        assert result["recorder"] == 6
+        assert result.title == "[Home](index.md)"
+        assert [heading.title for heading in result.headings] == ["[Home](index.md)", "Next"]
+        assert result.links == extract_links(content)
+
+    def test_token_extractors_match_standalone_functions(self):
+        samples = [
+            CONTENT,
+            "",
+            "#\tTab\n# Real",
+            "```\n# In code\n```\n  # Indented #",
+            "Intro [a](b)\n<img\n  src='c.png'>\n## x [![d](e)](f)",
+            '[unclosed\n# Title [x](y) ![z](w "t")',
+        ]
+
+        for content in samples:
+            result = ExtractionPipeline([TitleExtractor, LinksExtractor]).run(content)
+            assert result.title == extract_title(content)
+            assert result.links == extract_links(content)
+            assert LinksExtractor().extract(content) == extract_links(content)
+
+    def test_custom_whole_content_extractor(self):
+        class TodoExtractor(Extractor):
+            name = "todos"
+
+            def extract(self, content):
+                return [match.start() for match in re.finditer("TODO", content)]
+
+        result = ExtractionPipeline([TodoExtractor]).run("TODO one\nthen TODO two")
+
+        assert result["todos"] == [0, 14]
+
+    def test_extractor_must_implement_extract(self):
+        class Incomplete(Extractor):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            Incomplete()  # pyright: ignore[reportAbstractUsage]
+
+    def test_headings_skip_fenced_code(self):
+        content = "# A\n~~~~\n# in code\n~~~\n## still code\n~~~~\n  ## B ##\n#NoSpace\n####### Seven\n```\n# open"
+
+        result = ExtractionPipeline().run(content)
+
+        assert result.headings == [Heading("A", 1, 0), Heading("B", 2, 6)]
+
+    def test_ignores_unterminated_frontmatter(self):
+        result = ExtractionPipeline().run("---\nkey: value\n# Title")
+
+        assert result.frontmatter == {}
+
+    def test_reading_time_uses_words_per_minute(self):
+        result = ExtractionPipeline([lambda: StatsExtractor(words_per_minute=2)]).run("one two three four")
+
+        assert result.stats is not None
+        assert result.stats.reading_time_minutes == 2.0
+
+    def test_handles_empty_content(self):
+        result = ExtractionPipeline().run("")
+
+        assert result.title is None
+        assert result.headings == []
+        assert result.stats == DocumentStats(lines=1, words=0, characters=0, reading_time_minutes=0.0)
+
+    def test_run_file(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write(CONTENT)
+            path = Path(f.name)
+
+        try:
+            assert ExtractionPipeline().run_file(path).title == "Guide"
+        finally:
+            path.unlink()
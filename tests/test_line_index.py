@@ -0,0 +1,58 @@
+"""Tests for line-start offset index."""
+
+from amplifier_module_markdown_utils import LineIndex
+from amplifier_module_markdown_utils.line_index import _LineCursor
+
+CASES = ["", "one line", "a\nb\nc", "trailing\n", "\n\nblank\n\n", "ünï\ncødé\n"]
+
+
+class TestLineIndex:
+    """Tests for LineIndex class."""
+
+    def test_matches_split(self):
+        for content in CASES:
+            index = LineIndex(content)
+            lines = content.split("\n")
+
+            assert index.line_count == len(lines) == len(index)
+            assert [index.line(i) for i in range(len(lines))] == lines
+
+    def test_maps_offsets_to_lines(self):
+        content = "ab\n\ncd\n"
+        index = LineIndex(content)
+
+        assert [index.line_of(offset) for offset in range(len(content) + 1)] == [0, 0, 0, 1, 2, 2, 2, 3]
+        assert index.line_start(2) == 4
+        assert index.line_end(2) == 6
+        assert index.line_start(index.line_count) == len(content)
+
+    def test_insert_at_line_matches_list_insert(self):
+        for content in CASES:
+            index = LineIndex(content)
+            for line_number in range(index.line_count + 1):
+                lines = content.split("\n")
+                lines.insert(line_number, "\nNEW\n")
+
+                assert index.insert_at_line(line_number, "\nNEW\n") == "\n".join(lines)
+
+    def test_lines_stops_at_end(self):
+        index = LineIndex("a\nb\nc")
+
+        assert list(index.lines(1, 10)) == ["b", "c"]
+        assert list(index.lines(-2, 1)) == ["a"]
+        assert list(index.lines(5, 8)) == []
+
+
+class TestLineCursor:
+    """Tests for _LineCursor, the index-free path for one-off edits."""
+
+    def test_matches_line_index(self):
+        big = "".join(f"line {i}\n" for i in range(5000))
+        for content in [*CASES, big]:
+            index = LineIndex(content)
+            for first in sorted({0, 1, 17, 300, 4097, index.line_count - 1, index.line_count, index.line_count + 2}):
+                cursor = _LineCursor(content, first)
+
+                assert list(cursor.lines(first, first + 20)) == list(index.lines(first, first + 20))
+                for line_number in range(first, first + 3):
+                    assert cursor.insert_at_line(line_number, "NEW") == index.insert_at_line(line_number, "NEW")
@@ -0,0 +1,98 @@
+"""Tests for link and image inventory."""
+
+import tempfile
+import time
+from pathlib import Path
+
+from amplifier_module_markdown_utils import LinkRef
+from amplifier_module_markdown_utils import extract_links
+from amplifier_module_markdown_utils import extract_links_from_files
+
+
+class TestExtractLinks:
+    """Tests for extract_links function."""
+
+    def test_finds_links_and_images(self):
+        content = (
+            "# Title\n"
+            'See [the docs](https://example.com/docs) and [api](api.md "API").\n'
+            "\n"
+            "![Diagram](images/diagram.png)\n"
+            '<p><IMG alt="Photo" width="50%" src=\'images/photo.jpg\'></p>'
+        )
+
+        inventory = extract_links(content)
+
+        assert inventory.refs == [
+            LinkRef("link", "https://example.com/docs", "the docs", 1, content.index("[the")),
+            LinkRef("link", "api.md", "api", 1, content.index("[api")),
+            LinkRef("image", "images/diagram.png", "Diagram", 3, content.index("![D")),
+            LinkRef("html_image", "images/photo.jpg", "Photo", 4, content.index("<IMG")),
+        ]
+        assert [ref.target for ref in inventory.links] == ["https://example.com/docs", "api.md"]
+        assert inventory.image_targets == {"images/diagram.png", "images/photo.jpg"}
+
+    def test_offsets_point_at_reference(self):
+        content = "Intro\n\nText ![A](a.png) more [b](b.md)"
+
+        for ref in extract_links(content).refs:
+            assert content[ref.offset] in "![<"
+            assert content.split("\n")[ref.line_number].count(ref.target) == 1
+
+    def test_finds_image_inside_link(self):
+        content = '# Title\n[![build](badge.svg)](https://ci) and [<img src="logo.png">](/)'
+
+        inventory = extract_links(content)
+
+        assert inventory.refs == [
+            LinkRef("link", "https://ci", "![build](badge.svg)", 1, content.index("[![")),
+            LinkRef("image", "badge.svg", "build", 1, content.index("![build")),
+            LinkRef("link", "/", '<img src="logo.png">', 1, content.index("[<img")),
+            LinkRef("html_image", "logo.png", "", 1, content.index("<img")),
+        ]
+        assert inventory.has_image("badge.svg")
+
+    def test_link_text_with_image_and_words(self):
+        inventory = extract_links("[![a](b) text](c.md)")
+
+        assert [(ref.kind, ref.target) for ref in inventory.refs] == [("link", "c.md"), ("image", "b")]
+
+    def test_ignores_unterminated_nested_brackets(self):
+        assert extract_links("[![a](" * 100 + "]").refs == []
+
+    def test_unclosed_brackets_scan_in_linear_time(self):
+        content = "value = x[0\n" * 20000 + "[end](end.md)"
+
+        start = time.perf_counter()
+        inventory = extract_links(content)
+        elapsed = time.perf_counter() - start
+
+        assert [ref.target for ref in inventory.refs] == ["end.md"]
+        assert elapsed < 1.0
+
+    def test_ignores_img_without_src(self):
+        inventory = extract_links('<img alt="nothing">')
+
+        assert inventory.refs == []
+        assert not inventory.has_image("")
+
+    def test_handles_empty_content(self):
+        assert extract_links("").refs == []
+
+
+class TestExtractLinksFromFiles:
+    """Tests for extract_links_from_files function."""
+
+    def test_scans_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a = Path(tmp) / "a.md"
+            b = Path(tmp) / "b.md"
+            a.write_text("![A](a.png)", encoding="utf-8")
+            b.write_text("[B](b.md)", encoding="utf-8")
+            missing = Path(tmp) / "missing.md"
+
+            inventories = extract_links_from_files([a, missing, b])
+
+            assert list(inventories) == [a, b]
+            assert inventories[a].has_image("a.png")
+            assert inventories[b].links[0].target == "b.md"
@@ -0,0 +1,119 @@
+"""Memory benchmarks: tracemalloc peak and retained bytes per input byte.
+
+Each public API is measured across document sizes and shapes and checked
+against the budgets in ``memory_budgets.json``. A change that multiplies
+per-document memory fails here. Run this file directly to print a report:
+
+    uv run python tests/test_memory.py
+"""
+
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from amplifier_module_markdown_utils import MarkdownImageUpdater
+from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import extract_title_from_file
+
+BUDGETS_PATH = Path(__file__).with_name("memory_budgets.json")
+BUDGETS: dict[str, dict[str, dict[str, float]]] = json.loads(BUDGETS_PATH.read_text(encoding="utf-8"))
+
+SIZES = [64_000, 512_000]
+
+PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua.\n"
+)
+SHAPES = {
+    "prose": "## Section\n\n" + PARAGRAPH * 8 + "\n",
+    "short_lines": "## List\n" + "- item\n" * 30,
+    "many_sections": "## Heading\nText.\n",
+    "long_lines": "## Big\n\n" + "word " * 4000 + "\n\n",
+}
+
+
+def make_document(shape: str, size: int) -> str:
+    """Build a document of roughly ``size`` bytes by repeating a shape's unit."""
+    unit = SHAPES[shape]
+    return ("# Title\n\n" + unit * (size // len(unit) + 1))[:size]
+
+
+def measure(fn: Callable[..., object], *args: object) -> tuple[int, int]:
+    """Return (peak, retained) bytes allocated while calling ``fn``.
+
+    Retained bytes are those still allocated once the call returns, while
+    its result is alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = fn(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - baseline, current - baseline
+
+
+def run_api(api: str, content: str, path: Path) -> tuple[int, int]:
+    """Measure one API on a document, given both as a string and a file."""
+    if api == "parse":
+        return measure(MarkdownParser().parse, content)
+    if api == "parse_file":
+        return measure(MarkdownParser().parse_file, path)
+    if api == "insert_image":
+        return measure(MarkdownImageUpdater().insert_image, content, content.count("\n") // 2, "images/pic.png")
+    if api == "extract_title_from_file":
+        return measure(extract_title_from_file, path)
+    raise ValueError(f"Unknown API: {api}")
+
+
+CASES = [(api, shape) for api in BUDGETS for shape in BUDGETS[api]]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(("api", "shape"), CASES)
+def test_memory_within_budget(api: str, shape: str, size: int, tmp_path: Path):
+    content = make_document(shape, size)
+    path = tmp_path / "doc.md"
+    path.write_text(content, encoding="utf-8")
+    input_bytes = len(content.encode("utf-8"))
+
+    peak, retained = run_api(api, content, path)
+
+    budget = BUDGETS[api][shape]
+    assert peak / input_bytes <= budget["peak"], (
+        f"{api} on {shape} ({size} bytes): peak {peak / input_bytes:.2f} bytes/input byte "
+        f"exceeds budget {budget['peak']}"
+    )
+    assert retained / input_bytes <= budget["retained"], (
+        f"{api} on {shape} ({size} bytes): retained {retained / input_bytes:.2f} bytes/input byte "
+        f"exceeds budget {budget['retained']}"
+    )
+
+
+def test_budgets_cover_every_shape():
+    for api, shapes in BUDGETS.items():
+        assert set(shapes) == set(SHAPES), api
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.md"
+        print(f"{'api':<24}{'shape':<15}{'size':>9}{'peak/B':>9}{'budget':>8}{'kept/B':>9}{'budget':>8}")
+        for api, shape in CASES:
+            for size in SIZES:
+                content = make_document(shape, size)
+                path.write_text(content, encoding="utf-8")
+                peak, retained = run_api(api, content, path)
+                budget = BUDGETS[api][shape]
+                print(
+                    f"{api:<24}{shape:<15}{size:>9}{peak / size:>9.2f}{budget['peak']:>8}"
+                    f"{retained / size:>9.2f}{budget['retained']:>8}"
+                )
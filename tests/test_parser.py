@@ -1,9 +1,14 @@
 """Tests for markdown parser."""
 
+import random
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+from amplifier_module_markdown_utils import MarkdownParseError
 from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import ParseLimits
 
 
 class TestMarkdownParser:
@@ -110,3 +115,227 @@ Line 9"""
         assert "## Section" in doc.sections[0].content
         assert "Line 1" in doc.sections[0].content
         assert "Line 2" in doc.sections[0].content
+
+
+class TestSelectSections:
+    """Tests for MarkdownParser.select_sections."""
+
+    CONTENT = """# Title
+
+Intro
+
+## Setup
+
+Setup text
+
+### Setup Details
+
+Details
+
+## Usage
+
+Usage text
+
+# Late H1
+
+## Setup Again
+
+More"""
+
+    def test_filters_by_level(self):
+        parser = MarkdownParser()
+        expected = [s for s in parser.parse(self.CONTENT).sections if s.level == 2]
+
+        assert parser.select_sections(self.CONTENT, level=2) == expected
+
+    def test_filters_by_title_regex(self):
+        parser = MarkdownParser()
+
+        sections = parser.select_sections(self.CONTENT, title_regex="^Setup")
+
+        assert [s.title for s in sections] == ["Setup", "Setup Details", "Setup Again"]
+        assert sections == [s for s in parser.parse(self.CONTENT).sections if s.title.startswith("Setup")]
+
+    def test_filters_with_where(self):
+        parser = MarkdownParser()
+
+        sections = parser.select_sections(self.CONTENT, where=lambda title, level: level == 3)
+
+        assert [s.title for s in sections] == ["Setup Details"]
+        assert sections[0].content == "### Setup Details\n\nDetails\n"
+
+    def test_stops_at_limit(self):
+        parser = MarkdownParser()
+
+        sections = parser.select_sections(self.CONTENT, level=2, limit=2)
+
+        assert [s.title for s in sections] == ["Setup", "Usage"]
+        assert "# Late H1" in sections[1].content
+        assert parser.select_sections(self.CONTENT, limit=0) == []
+
+    def test_no_filters_matches_parse(self):
+        parser = MarkdownParser()
+
+        assert parser.select_sections(self.CONTENT) == parser.parse(self.CONTENT).sections
+
+    def test_select_sections_file(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write(self.CONTENT)
+            path = Path(f.name)
+
+        try:
+            sections = MarkdownParser().select_sections_file(path, title_regex="Usage")
+
+            assert len(sections) == 1
+            assert sections[0].line_number == 12
+        finally:
+            path.unlink()
+
+
+class TestParseLimits:
+    """Tests for MarkdownParser with ParseLimits."""
+
+    CONTENT = "# Title\n\n## One\n\nText\n\n## Two\n\nText\n\n## Three\n\nText"
+
+    def test_no_limit_hit_is_complete(self):
+        parser = MarkdownParser(limits=ParseLimits(max_bytes=1000, max_lines=100, max_sections=3, timeout=10))
+        doc = parser.parse(self.CONTENT)
+
+        assert doc == MarkdownParser().parse(self.CONTENT)
+        assert not doc.partial
+        assert doc.limit_reason is None
+
+    def test_raises_by_default(self):
+        parser = MarkdownParser(limits=ParseLimits(max_sections=2))
+
+        with pytest.raises(MarkdownParseError, match="more than 2 sections"):
+            parser.parse(self.CONTENT)
+
+    def test_truncates_at_section_limit(self):
+        parser = MarkdownParser(limits=ParseLimits(max_sections=2, on_limit="truncate"))
+        doc = parser.parse(self.CONTENT)
+
+        assert doc.partial
+        assert [s.title for s in doc.sections] == ["One", "Two"]
+        assert doc.sections[1].content == "## Two\n\nText\n"
+
+    def test_truncates_at_line_limit(self):
+        parser = MarkdownParser(limits=ParseLimits(max_lines=5, on_limit="truncate"))
+        doc = parser.parse(self.CONTENT)
+
+        assert doc.partial
+        assert doc.limit_reason == "more than 5 lines"
+        assert doc.sections[0].content == "## One\n\nText"
+
+    def test_truncates_at_long_line(self):
+        parser = MarkdownParser(limits=ParseLimits(max_line_length=10, on_limit="truncate"))
+        doc = parser.parse("# Title\n\n## Section\n" + "x" * 11 + "\n## Never")
+
+        assert doc.partial
+        assert [s.title for s in doc.sections] == ["Section"]
+
+    def test_truncates_at_size_limit(self):
+        parser = MarkdownParser(limits=ParseLimits(max_bytes=20, on_limit="truncate"))
+        doc = parser.parse(self.CONTENT)
+
+        assert doc.partial
+        assert doc.raw_content == self.CONTENT[:20]
+        assert [s.title for s in doc.sections] == ["One"]
+
+    def test_times_out(self):
+        parser = MarkdownParser(limits=ParseLimits(timeout=0))
+
+        with pytest.raises(MarkdownParseError, match="exceeded"):
+            parser.parse(self.CONTENT)
+
+    def test_rejects_invalid_on_limit(self):
+        with pytest.raises(ValueError):
+            ParseLimits(on_limit="ignore")
+
+    def test_parse_file_checks_size_before_reading(self):
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".md", delete=False) as f:
+            f.write("# Title\n\n## Café\n".encode("utf-8"))
+            path = Path(f.name)
+
+        try:
+            with pytest.raises(MarkdownParseError, match="exceeds 16 bytes"):
+                MarkdownParser(limits=ParseLimits(max_bytes=16)).parse_file(path)
+
+            # Byte 16 falls inside the two-byte "é"
+            doc = MarkdownParser(limits=ParseLimits(max_bytes=16, on_limit="truncate")).parse_file(path)
+            assert doc.partial
+            assert doc.raw_content == "# Title\n\n## Caf"
+            assert doc.sections[0].title == "Caf"
+        finally:
+            path.unlink()
+
+
+class TestParseParallel:
+    """Tests for MarkdownParser.parse_parallel."""
+
+    @staticmethod
+    def make_document(seed: int) -> str:
+        rng = random.Random(seed)
+        lines = []
+        for i in range(400):
+            lines.append(
+                rng.choice(
+                    [
+                        f"## Section {i}",
+                        f"  ### Sub {i}  ",
+                        f"# Heading {i}",
+                        "#",
+                        "#### Deep",
+                        "##  ",
+                        "",
+                        f"Text line {i}",
+                        "- item",
+                    ]
+                )
+            )
+        return "\n".join(lines)
+
+    def test_matches_serial_parse(self):
+        parser = MarkdownParser()
+        with ThreadPoolExecutor(4) as executor:
+            for seed in range(20):
+                content = self.make_document(seed)
+                for workers in (2, 3, 7):
+                    doc = parser.parse_parallel(content, workers=workers, min_chunk_size=50, executor=executor)
+
+                    assert doc == parser.parse(content), (seed, workers)
+
+    def test_uses_process_pool_by_default(self):
+        content = self.make_document(7)
+        parser = MarkdownParser()
+
+        assert parser.parse_parallel(content, workers=2, min_chunk_size=50) == parser.parse(content)
+
+    def test_title_found_after_first_range(self):
+        content = "Intro\n\n" + "## Section\n\nText\n\n" * 50 + "# Late Title\n\nMore"
+        parser = MarkdownParser()
+
+        doc = parser.parse_parallel(content, workers=4, min_chunk_size=10)
+
+        assert doc == parser.parse(content)
+        assert doc.title == "Late Title"
+
+    def test_small_or_limited_documents_parse_serially(self):
+        content = "# Title\n\n## A\n\nText\n\n## B\n\nText"
+
+        assert MarkdownParser().parse_parallel(content, workers=4) == MarkdownParser().parse(content)
+        limited = MarkdownParser(limits=ParseLimits(max_sections=1, on_limit="truncate"))
+        assert limited.parse_parallel(content, workers=4, min_chunk_size=1).partial
+
+    def test_parse_file_with_workers(self):
+        content = self.make_document(99)
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write(content)
+            path = Path(f.name)
+
+        try:
+            doc = MarkdownParser().parse_file(path, workers=2)
+
+            assert doc == MarkdownParser().parse(content)
+        finally:
+            path.unlink()
@@ -0,0 +1,148 @@
+"""Tests for streaming HTML renderer."""
+
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from amplifier_module_markdown_utils import HtmlRenderer
+from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import ParseLimits
+
+
+def render(content: str) -> str:
+    return HtmlRenderer().render_to_string(MarkdownParser().parse(content))
+
+
+class TestHtmlRenderer:
+    """Tests for HtmlRenderer class."""
+
+    def test_renders_headings_with_anchors(self):
+        result = render("# My Title\n\n## Getting Started\n\n## Getting Started\n\n### C# Tips ###")
+
+        assert result == (
+            '<h1 id="my-title">My Title</h1>\n'
+            '<h2 id="getting-started">Getting Started</h2>\n'
+            '<h2 id="getting-started-1">Getting Started</h2>\n'
+            '<h3 id="c-tips">C# Tips</h3>\n'
+        )
+
+    def test_suffixed_anchor_skips_existing_heading_slug(self):
+        result = render("# Doc\n\n## A\n\n## A\n\n## a-1\n\n## a")
+
+        assert [line.split('"')[1] for line in result.splitlines()] == ["doc", "a", "a-1", "a-1-1", "a-2"]
+
+    def test_renders_paragraphs(self):
+        result = render("First line\nsecond line\n\nNext <para> & more")
+
+        assert result == "<p>First line\nsecond line</p>\n<p>Next &lt;para&gt; &amp; more</p>\n"
+
+    def test_renders_fenced_code(self):
+        result = render("```python\nif a < b:\n    pass\n\n# not a heading\n```\nAfter")
+
+        assert result == (
+            '<pre><code class="language-python">if a &lt; b:\n    pass\n\n# not a heading\n</code></pre>\n'
+            "<p>After</p>\n"
+        )
+
+    def test_closes_unterminated_fence(self):
+        assert render("~~~\ncode") == "<pre><code>code\n</code></pre>\n"
+
+    def test_renders_inline_elements(self):
+        result = render('See [the "docs"](docs.md "Docs"), ![Pic](images/p.png) and `x<y`.')
+
+        assert result == (
+            '<p>See <a href="docs.md" title="Docs">the "docs"</a>, '
+            '<img src="images/p.png" alt="Pic"> and <code>x&lt;y</code>.</p>\n'
+        )
+
+    def test_passes_through_html_lines(self):
+        result = render('Intro\n\n<img src="images/a.png" alt="A" width="50%">\n')
+
+        assert result == '<p>Intro</p>\n<img src="images/a.png" alt="A" width="50%">\n'
+
+    def test_renders_linked_image(self):
+        result = render("[![build](badge.svg)](http://x)")
+
+        assert result == '<p><a href="http://x"><img src="badge.svg" alt="build"></a></p>\n'
+
+    def test_escape_html_option(self):
+        doc = MarkdownParser().parse('<script>alert("x")</script>\n\n## Notes\n\n<img src="a.png">')
+
+        result = HtmlRenderer(escape_html=True).render_to_string(doc)
+
+        assert "<script>" not in result
+        assert result == (
+            '<p>&lt;script&gt;alert("x")&lt;/script&gt;</p>\n'
+            '<h2 id="notes">Notes</h2>\n'
+            '<p>&lt;img src="a.png"&gt;</p>\n'
+        )
+
+    def test_unclosed_brackets_render_in_linear_time(self):
+        out = io.StringIO()
+
+        start = time.perf_counter()
+        HtmlRenderer().render_lines(["value = x[0"] * 20000 + ["[end](end.md)"], out)
+        elapsed = time.perf_counter() - start
+
+        assert out.getvalue().endswith('<a href="end.md">end</a></p>\n')
+        assert elapsed < 1.0
+
+    def test_escape_html_neutralizes_script_urls(self):
+        content = (
+            "[click](javascript:alert(1)) [v](VBScript:x) [d](data:text/html,x)\n"
+            "![pic](data:image/png;base64,AA) ![js](java\x01script:x) [ok](https://example.com)"
+        )
+
+        result = HtmlRenderer(escape_html=True).render_to_string(MarkdownParser().parse(content))
+
+        assert result == (
+            '<p><a href="#">click</a>) <a href="#">v</a> <a href="#">d</a>\n'
+            '<img src="data:image/png;base64,AA" alt="pic"> <img src="#" alt="js"> '
+            '<a href="https://example.com">ok</a></p>\n'
+        )
+        assert render("[click](javascript:alert(1))") == '<p><a href="javascript:alert(1">click</a>)</p>\n'
+
+    def test_headings_follow_parsed_sections(self):
+        doc = MarkdownParser().parse("# Title\n\n## A\n\n#### Detail\n\n##\tNot a section\n\n## B\n\nEnd")
+
+        result = HtmlRenderer().render_to_string(doc)
+
+        assert result == (
+            '<h1 id="title">Title</h1>\n'
+            '<h2 id="a">A</h2>\n'
+            '<h4 id="detail">Detail</h4>\n'
+            "<p>##\tNot a section</p>\n"
+            '<h2 id="b">B</h2>\n'
+            "<p>End</p>\n"
+        )
+
+    def test_renders_only_parsed_sections_of_partial_document(self):
+        parser = MarkdownParser(limits=ParseLimits(max_sections=1, on_limit="truncate"))
+        doc = parser.parse("Intro\n\n## Kept\n\nBody\n\n## Dropped\n\nMore")
+
+        result = HtmlRenderer().render_to_string(doc)
+
+        assert result == '<p>Intro</p>\n<h2 id="kept">Kept</h2>\n<p>Body</p>\n'
+
+    def test_section_heading_inside_code_stays_code(self):
+        result = render("# Title\n\n```sh\n## comment\necho hi\n```\n\n## Real")
+
+        assert result == (
+            '<h1 id="title">Title</h1>\n'
+            '<pre><code class="language-sh">## comment\necho hi\n</code></pre>\n'
+            '<h2 id="real">Real</h2>\n'
+        )
+
+    def test_render_file_streams_to_output(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False, newline="") as f:
+            f.write("# Title\r\n\r\nBody text\r\n")
+            path = Path(f.name)
+
+        try:
+            out = io.StringIO()
+            HtmlRenderer().render_file(path, out)
+
+            assert out.getvalue() == '<h1 id="title">Title</h1>\n<p>Body text</p>\n'
+        finally:
+            path.unlink()
@@ -0,0 +1,141 @@
+"""Tests for shared-memory parsed corpus."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from amplifier_module_markdown_utils import MarkdownParseError
+from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import ParseLimits
+from amplifier_module_markdown_utils import SharedCorpus
+from amplifier_module_markdown_utils.shared import _HEADER
+
+DOCUMENTS = {
+    "intro.md": "# Intro\n\nWelcome — ünïcode text\n\n## Setup\n\nSteps\n\n### Details\n\nMore",
+    "untitled.md": "## Only Section\n\nBody",
+    "late-title.md": "## First\n\nText\n\n# Late Title\n\nAfter",
+    "empty.md": "",
+}
+
+
+def parsed_documents():
+    parser = MarkdownParser()
+    return {key: parser.parse(content) for key, content in DOCUMENTS.items()}
+
+
+def summarize(name: str) -> dict[str, tuple]:
+    corpus = SharedCorpus.attach(name)
+    try:
+        return {
+            key: (doc.title, [(s.title, s.level, s.line_number, s.content) for s in doc.sections])
+            for key, doc in ((key, corpus[key]) for key in corpus)
+        }
+    finally:
+        corpus.close()
+
+
+class TestSharedCorpus:
+    """Tests for SharedCorpus class."""
+
+    def test_round_trips_documents(self):
+        documents = parsed_documents()
+
+        with SharedCorpus.create(documents) as corpus:
+            assert len(corpus) == len(documents)
+            assert list(corpus) == list(documents)
+            assert "intro.md" in corpus
+            for key, document in documents.items():
+                assert corpus[key].to_document() == document
+
+    def test_round_trips_partial_documents(self):
+        parser = MarkdownParser(limits=ParseLimits(max_sections=1, on_limit="truncate"))
+        documents = {"partial.md": parser.parse(DOCUMENTS["intro.md"]), **parsed_documents()}
+
+        with SharedCorpus.create(documents) as corpus:
+            partial = corpus["partial.md"]
+            assert partial.partial is True
+            assert partial.limit_reason == documents["partial.md"].limit_reason is not None
+            assert partial.to_document() == documents["partial.md"]
+            assert corpus["intro.md"].partial is False
+            assert corpus["intro.md"].limit_reason is None
+
+    def test_views_are_compatible(self):
+        with SharedCorpus.create(parsed_documents()) as corpus:
+            doc = corpus["intro.md"]
+
+            assert doc.title == "Intro"
+            assert doc.raw_content == DOCUMENTS["intro.md"]
+            assert [s.title for s in doc.sections] == ["Setup", "Details"]
+            assert doc.sections[1].level == 3
+            assert doc.sections[0].content == "## Setup\n\nSteps\n"
+            assert corpus["untitled.md"].title is None
+            assert corpus["empty.md"].sections == []
+
+    def test_workers_attach_read_only(self):
+        documents = parsed_documents()
+        expected = {
+            key: (doc.title, [(s.title, s.level, s.line_number, s.content) for s in doc.sections])
+            for key, doc in documents.items()
+        }
+
+        with SharedCorpus.create(documents) as corpus:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(2) as pool:
+                results = pool.map(summarize, [corpus.name, corpus.name])
+
+            assert results == [expected, expected]
+            assert corpus["intro.md"].title == "Intro"
+
+    def test_workers_leave_creator_registration_alone(self):
+        script = textwrap.dedent(
+            """
+            import multiprocessing
+            from amplifier_module_markdown_utils import MarkdownParser, SharedCorpus
+            from tests.test_shared import summarize
+
+            if __name__ == "__main__":
+                corpus = SharedCorpus.create({"a.md": MarkdownParser().parse("# A\\n\\n## B")})
+                with multiprocessing.get_context("spawn").Pool(2) as pool:
+                    pool.map(summarize, [corpus.name] * 2)
+                SharedCorpus.attach(corpus.name).close()
+                corpus.close()
+                corpus.unlink()
+            """
+        )
+
+        result = _run_python(script)
+
+        assert result.returncode == 0, result.stderr
+        assert "KeyError" not in result.stderr
+        assert "leaked" not in result.stderr
+
+    def test_unrelated_process_does_not_unlink(self):
+        with SharedCorpus.create(parsed_documents()) as corpus:
+            script = f"from amplifier_module_markdown_utils import SharedCorpus\nSharedCorpus.attach({corpus.name!r}).close()"
+
+            result = _run_python(script)
+
+            assert result.returncode == 0, result.stderr
+            assert "leaked" not in result.stderr
+            attached = SharedCorpus.attach(corpus.name)
+            assert attached["intro.md"].title == "Intro"
+            attached.close()
+
+    def test_rejects_foreign_segment(self):
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER.size)
+        try:
+            with pytest.raises(MarkdownParseError):
+                SharedCorpus.attach(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def _run_python(script: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
@@ -0,0 +1,165 @@
+"""Tests for content-addressed section store."""
+
+import gc
+import sys
+import tracemalloc
+
+import pytest
+
+from amplifier_module_markdown_utils import MarkdownError
+from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import MarkdownSection
+from amplifier_module_markdown_utils import SectionStore
+from amplifier_module_markdown_utils import SectionStoreStats
+from amplifier_module_markdown_utils import store as store_module
+from amplifier_module_markdown_utils.store import _UNUSED_REFCOUNT
+from amplifier_module_markdown_utils.store import _refcounts
+
+FOOTER = "## License\n\n" + "Licensed under the MIT license. See LICENSE for details.\n" * 4
+
+
+def _section(content: str, line_number: int = 0) -> MarkdownSection:
+    # Join at runtime so each section starts with its own copy of the text
+    return MarkdownSection("Section", 2, line_number, "".join(["", content]))
+
+
+class TestSectionStore:
+    """Tests for SectionStore class."""
+
+    def test_shares_identical_content(self):
+        store = SectionStore(min_length=0)
+        a = store.add(_section("## License\nMIT"))
+        b = store.add(_section("## License\nMIT", 9))
+
+        assert a.content is b.content
+        assert len(store) == 1
+        stats = store.stats()
+        size = sys.getsizeof(a.content)
+        assert stats.unique_sections == 1
+        assert stats.references == 2
+        assert stats.unique_bytes == size
+        assert stats.referenced_bytes == 2 * size
+        assert stats.overhead_bytes > 0
+
+    def test_stats_include_overhead(self):
+        stats = SectionStoreStats(1, 4, unique_bytes=100, referenced_bytes=400, overhead_bytes=100)
+
+        assert stats.dedup_ratio == 2.0
+        assert stats.saved_bytes == 200
+
+    def test_unshared_content_costs_memory(self):
+        store = SectionStore(min_length=0)
+        sections = [store.add(_section(f"## S{i}")) for i in range(10)]
+
+        stats = store.stats()
+        assert stats.references == len(sections)
+        assert stats.dedup_ratio < 1.0
+        assert stats.saved_bytes < 0
+
+    def test_skips_short_content(self):
+        store = SectionStore(min_length=10)
+        short = store.add(_section("## Short"))
+        long = store.add(_section("## Long enough"))
+
+        assert "## Short" not in store
+        assert long.content in store
+        assert short.content == "## Short"
+
+    def test_evicts_unreferenced_content(self):
+        store = SectionStore(min_length=0)
+        section = store.add(_section("## Temp"))
+        kept = store.add(_section("## Kept"))
+
+        del section
+
+        assert store.evict() == 1
+        assert "## Temp" not in store
+        assert "## Kept" in store
+        assert store.stats().references == 1
+        assert kept.content == "## Kept"
+
+    def test_stats_reflect_released_sections(self):
+        store = SectionStore(min_length=0)
+        sections = [store.add(_section("## Shared")) for _ in range(3)]
+
+        assert store.stats().references == 3
+        sections.pop()
+        assert store.stats().references == 2
+        sections.clear()
+        assert store.stats().unique_sections == 0
+
+    def test_empty_store_stats(self):
+        stats = SectionStore().stats()
+
+        assert stats.dedup_ratio == 1.0
+        assert stats.saved_bytes == -stats.overhead_bytes
+
+
+class TestParserWithStore:
+    """Tests for MarkdownParser with a shared SectionStore."""
+
+    def test_parser_deduplicates_across_documents(self):
+        store = SectionStore(min_length=0)
+        parser = MarkdownParser(section_store=store)
+
+        docs = [parser.parse(f"# Doc {i}\n\n## Body\n\nText {i}\n\n{FOOTER}") for i in range(10)]
+
+        stats = store.stats()
+        assert stats.unique_sections == 11
+        assert stats.references == 20
+        assert stats.dedup_ratio > 1.0
+        assert all(doc.sections[1].content is docs[0].sections[1].content for doc in docs)
+
+        del docs
+        assert store.evict() == 11
+        assert len(store) == 0
+
+    def test_store_reduces_memory_of_duplicated_corpus(self):
+        corpus = [f"# Doc {i}\n\n## Body\n\nUnique text {i}\n\n{FOOTER}" for i in range(500)]
+
+        def retained(store: SectionStore | None) -> int:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                parser = MarkdownParser(section_store=store)
+                docs = [parser.parse(content) for content in corpus]
+                gc.collect()
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(docs) == len(corpus)
+            if store is not None:
+                assert store.stats().saved_bytes > 0
+            return size
+
+        with_store = retained(SectionStore())
+        without_store = retained(None)
+
+        assert with_store < without_store * 0.8
+
+    def test_parser_without_store_is_unchanged(self):
+        doc = MarkdownParser().parse(f"# Title\n\n{FOOTER}")
+
+        assert doc.sections[0].content == FOOTER
+
+
+class TestRefcountCalibration:
+    """Tests for the interpreter check behind section lifetimes."""
+
+    def test_calibration_detects_references(self):
+        # Fails loudly if an interpreter change stops reference counts from tracking liveness
+        assert _UNUSED_REFCOUNT is not None
+        strings = {"".join(["calibration ", "probe"]): ""}
+        strings = {content: content for content in strings}
+
+        (unused,) = _refcounts(strings)
+        held = next(iter(strings))
+        assert _refcounts(strings) == [unused + 1]
+        del held
+        assert _refcounts(strings) == [unused] == [_UNUSED_REFCOUNT]
+
+    def test_store_refuses_uncalibrated_interpreter(self, monkeypatch):
+        monkeypatch.setattr(store_module, "_UNUSED_REFCOUNT", None)
+
+        with pytest.raises(MarkdownError, match="reference counting"):
+            SectionStore()
@@ -3,7 +3,10 @@
 import tempfile
 from pathlib import Path
 
+from amplifier_module_markdown_utils import LineIndex
 from amplifier_module_markdown_utils import MarkdownImageUpdater
+from amplifier_module_markdown_utils import MarkdownParser
+from amplifier_module_markdown_utils import extract_links
 
 
 class TestMarkdownImageUpdater:
@@ -97,3 +100,63 @@ class TestMarkdownImageUpdater:
 
         result = updater.insert_image(content, line_number=10, image_path="images/end.png", alt_text="End")
         assert "images/end.png" in result
+
+    def test_if_absent_skips_existing_image(self):
+        content = '# Title\n\n<img src="images/test.png" alt="Test">\n\nContent'
+        updater = MarkdownImageUpdater()
+
+        result = updater.insert_image(content, line_number=4, image_path="images/test.png", if_absent=True)
+        assert result == content
+
+        result = updater.insert_image(content, line_number=4, image_path="images/other.png", if_absent=True)
+        assert "images/other.png" in result
+
+    def test_if_absent_skips_linked_image(self):
+        content = "# Title\n\n[![build](images/badge.svg)](https://ci)\n\nContent"
+        updater = MarkdownImageUpdater()
+
+        result = updater.insert_image(content, line_number=4, image_path="images/badge.svg", if_absent=True)
+        assert result == content
+
+    def test_if_absent_reuses_inventory(self):
+        content = "# Title\n\n![Old](images/old.png)\n\nContent"
+        updater = MarkdownImageUpdater()
+        inventory = extract_links(content)
+
+        result = updater.insert_image(content, 4, "images/new.png", if_absent=True, inventory=inventory)
+        again = updater.insert_image(result, 4, "images/new.png", if_absent=True, inventory=inventory)
+
+        assert inventory.has_image("images/new.png")
+        assert again == result
+        assert result.count("images/new.png") == 1
+
+    def test_reuses_document_line_index(self):
+        content = "# Title\n\nIntro\n\n## Section\n\nText"
+        doc = MarkdownParser().parse(content)
+        updater = MarkdownImageUpdater()
+
+        result = updater.insert_image(content, 3, "images/pic.png", line_index=doc.line_index)
+
+        assert doc.line_index is doc.line_index
+        assert result == updater.insert_image(content, 3, "images/pic.png")
+        assert result.split("\n")[4] == '<img src="images/pic.png" alt="" width="50%">'
+
+    def test_insert_without_index_matches_indexed_insert(self):
+        content = "# Title\n\nIntro\n\n## One\n\nText\n\n## Two\n\nMore"
+        updater = MarkdownImageUpdater()
+        index = LineIndex(content)
+
+        for placement in ("at_line", "before_section", "after_intro"):
+            for line_number in (None, 0, 3, 7, 10, 11, 15):
+                expected = updater.insert_image(content, line_number, "p.png", placement=placement, line_index=index)
+
+                assert updater.insert_image(content, line_number, "p.png", placement=placement) == expected
+
+    def test_ignores_line_index_for_other_content(self):
+        updater = MarkdownImageUpdater()
+        stale = LineIndex("unrelated\ncontent\nwith\nmore\nlines")
+
+        result = updater.insert_image("a\nb", 1, "images/pic.png", line_index=stale)
+
+        assert result == updater.insert_image("a\nb", 1, "images/pic.png")
+        assert result.startswith("a\n\n<img")